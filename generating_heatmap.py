@@ -1,28 +1,321 @@
+import os
+# The HDF5 files are only ever read: skip HDF5's file locking, which costs
+# fcntl calls on every open. Must be set before h5py is imported.
+os.environ.setdefault('HDF5_USE_FILE_LOCKING', 'FALSE')
+import io
+import ctypes
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')  # Render straight to PNG files, no GUI backend needed
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import Normalize
+from matplotlib.figure import Figure
 import h5py
-import os
 import subprocess
 import sys
 import shutil
+import tempfile
 import glob
 import argparse
+import inspect
+import multiprocessing
+import atexit
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+# Platform check done once instead of in every retry of the cleanup loop
+IS_WIN = sys.platform == 'win32'
+# Forecast models stacked along the last axis of the api_x.h5 dataset
+MODELS = ('best_match', 'ecmwf_ifs', 'gfs_global', 'AIFS', 'CMA')
+# Column of the ECMWF forecast, the baseline the other sources are compared to
+ECMWF_IDX = MODELS.index('ecmwf_ifs')
+# Panel labels of the heatmap columns: the forecast models, then ENS AIFS
+PANEL_LABELS = (
+    'Best Match - ECMWF\n(relative to ERA5)',
+    'ECMWF RMSE\n(absolute values)',
+    'GFS Global - ECMWF\n(relative to ERA5)',
+    'AIFS - ECMWF\n(relative to ERA5)',
+    'CMA - ECMWF\n(relative to ERA5)',
+    'ENS AIFS - ECMWF\n(relative to ERA5)',
+)
+# Variables stacked along the second-to-last axis, in file order
+VARIABLES = ('2t', '2d', '100u', '100v', 'tp', 'sp')
+# Row labels of the heatmaps, one per variable
+FEATURE_NAMES = ('temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp')
+# Number of forecast hours rendered per RAR file (one PNG per hour)
+N_HOURS = 24
+# Hour names used in the PNG file names and panel titles
+HOURS = tuple(f'{hour}h' for hour in range(1, N_HOURS + 1))
+# HDF5 files expected in each RAR archive (z.h5 is optional)
+H5_FILENAMES = ('api_x.h5', 'y.h5', 'z.h5')
+# HDF5 members are read straight from the RAR archive into memory when their
+# combined size stays below this limit; larger archives are extracted to disk
+MAX_IN_MEMORY_BYTES = 2 * 1024 ** 3
+# unrar executable bundled next to this script; when present it is used by
+# rarfile and by the command-line fallback instead of a system unrar/WinRAR
+BUNDLED_UNRAR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bin',
+                             'unrar.exe' if IS_WIN else 'unrar')
+# Thread switch of the unrar/WinRAR command line: decompress with all CPUs
+# (the tools accept at most 64 threads)
+UNRAR_THREADS = f'-mt{min(os.cpu_count() or 1, 64)}'
+# File masks passed to the unrar/WinRAR command line (with -r, so they match in
+# every archive folder): only the HDF5 files are unpacked, not the whole archive
+UNRAR_MASKS = tuple('*' + filename for filename in H5_FILENAMES)
+# Default cap of --workers: every render process keeps its own 300 dpi figure
+# and hour buffers (several hundred MB), so memory grows with each one
+DEFAULT_WORKERS = 4
+# zlib level of the saved PNG files: 1 encodes several times faster than the
+# default 6 for somewhat larger files
+PNG_COMPRESS_LEVEL = 1
+# HDF5 datasets are read and reordered in blocks of latitude rows of about this size
+READ_BLOCK_BYTES = 64 * 1024 * 1024
+# Open options for the forecast HDF5 files: a raw-data chunk cache far above
+# h5py's 1 MiB default, newest file format and larger metadata block reads
+H5_FILE_KWARGS = {'rdcc_nbytes': 128 * 1024 * 1024, 'rdcc_nslots': 10007, 'rdcc_w0': 0.75,
+                  'libver': 'latest'}
+# meta_block_size is only accepted by newer h5py releases; older ones reject
+# it with a TypeError on every open, so it is only passed when supported
+if 'meta_block_size' in inspect.signature(h5py.File.__init__).parameters:
+    H5_FILE_KWARGS['meta_block_size'] = 8 * 1024 * 1024
+# Initial size of the HDF5 metadata cache (HDF5 default is 2 MiB)
+H5_METADATA_CACHE_BYTES = 128 * 1024 * 1024
+
+# Extracted directories are deleted by a background thread, so locked files
+# can be retried while the next RAR file is already being processed
+_cleanup_queue = queue.Queue()
+_cleanup_thread = None
+
+# Figure reused by render_hour() across hours and RAR files rendered in this
+# process, as a (grid shape, fig, axes, images, texts) tuple
+_hour_figure = None
+
+# Error buffer reused by abs_errors() for every hour rendered in this process
+_error_buffer = None
+
+def import_rarfile():
+    """Import the rarfile library, pointing it at the bundled unrar executable if there is one.
+
+    Raises ImportError if rarfile is not installed.
+    """
+    import rarfile
+    if os.path.isfile(BUNDLED_UNRAR):
+        rarfile.UNRAR_TOOL = BUNDLED_UNRAR
+    return rarfile
+
+def find_h5_files(directory, filenames):
+    """Recursively search the directory for several HDF5 files in a single pass.
+
+    Returns a dict mapping each file name that was found to its path.
+    """
+    found = {}
+    # Breadth-first, so the shallowest match wins; stop as soon as all files are found
+    pending = deque([directory])
+    while pending and len(found) < len(filenames):
+        try:
+            with os.scandir(pending.popleft()) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        if entry.name in filenames and entry.name not in found:
+                            found[entry.name] = entry.path
+                    elif entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+        except OSError:
+            continue
+    return found
+
+def read_rar_h5_members(rar_path, filenames):
+    """Read HDF5 members of a RAR archive into memory buffers, keyed by file name.
+
+    Each value is a (location, buffer) tuple. Returns an empty dict when the
+    members cannot be read in memory, in which case the archive is extracted.
+    """
+    try:
+        rarfile = import_rarfile()
+    except ImportError:
+        return {}
+    
+    try:
+        with rarfile.RarFile(rar_path) as rf:
+            # Keep the first member found for each file name (h5 files may be in a subdirectory)
+            infos = {}
+            for info in rf.infolist():
+                name = os.path.basename(info.filename)
+                if name in filenames and name not in infos and not info.is_dir():
+                    infos[name] = info
+            
+            if sum(info.file_size for info in infos.values()) > MAX_IN_MEMORY_BYTES:
+                return {}
+            
+            return {name: (os.path.join(rar_path, info.filename), io.BytesIO(rf.read(info)))
+                    for name, info in infos.items()}
+    except Exception as e:
+        # rarfile library error (BadRarFile, RarCannotExec, etc.), extract instead
+        print(f"Could not read {rar_path} in memory: {e}")
+        return {}
+
+def enlarge_metadata_cache(f):
+    """Give an open HDF5 file a fixed metadata cache of H5_METADATA_CACHE_BYTES without evictions."""
+    try:
+        config = f.id.get_mdc_config()
+        config.set_initial_size = True
+        config.initial_size = H5_METADATA_CACHE_BYTES
+        config.max_size = max(config.max_size, H5_METADATA_CACHE_BYTES)
+        # HDF5 only accepts disabled evictions with automatic resizing turned off
+        config.evictions_enabled = False
+        config.incr_mode = 0
+        config.flash_incr_mode = 0
+        config.decr_mode = 0
+        f.id.set_mdc_config(config)
+    except Exception as e:
+        # The default cache still works, just slower
+        print(f"Warning: Could not configure HDF5 metadata cache: {e}")
+
+def prefetch_file(path):
+    """Ask the kernel to start reading a whole file into the page cache (Linux/macOS only)."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        # Only a hint: reading works the same without it
+        pass
+
+def read_h5_dataset(h5_file, first_hour=0, n_hours=N_HOURS, offsets=None):
+    """Read n_hours forecast hours, starting at first_hour, of the main dataset in an HDF5 file.
 
-def find_h5_file(directory, filename):
-    """Recursively search for an HDF5 file in the directory."""
-    for root, dirs, files in os.walk(directory):
-        if filename in files:
-            return os.path.join(root, filename)
+    h5_file is either a path or a binary file-like object holding the file. The
+    dataset is stored as (lat, lon, hour, variable, ...) and returned as float32
+    laid out as (hour, variable, ..., lat, lon), minus one offset per variable.
+
+    Returns (data, offsets). Without offsets, they are taken from the file when
+    it is stored wider than float32 (zero otherwise); pass the returned offsets
+    when reading the other files of the same RAR file, so their errors match.
+    """
+    if isinstance(h5_file, str):
+        # Check if file exists and is readable
+        if not os.path.exists(h5_file):
+            raise FileNotFoundError(f"HDF5 file not found: {h5_file}")
+        
+        # Check file size (HDF5 files should be at least a few bytes)
+        if os.path.getsize(h5_file) == 0:
+            raise ValueError(f"HDF5 file is empty: {h5_file}")
+        
+        # The dataset makes up nearly all of the file and is read in one pass:
+        # let readahead fetch it while HDF5 parses the metadata
+        prefetch_file(h5_file)
+    
+    with h5py.File(h5_file, 'r', **H5_FILE_KWARGS) as f:
+        enlarge_metadata_cache(f)
+        
+        # Try common dataset names, or use the first available dataset
+        if 'data' in f:
+            dataset = f['data']
+        elif 'dataset' in f:
+            dataset = f['dataset']
+        else:
+            keys = list(f.keys())
+            if not keys:
+                raise ValueError("No datasets found in HDF5 file")
+            dataset = f[keys[0]]
+
+        if dataset.ndim < 3:
+            raise ValueError(f"Expected hours on axis 2, got dataset of shape {dataset.shape}")
+
+        # Heatmaps don't need double precision: data of any numeric type is
+        # converted to float32 while reading, so every later step works on one
+        # dtype and float64 files take half the memory
+        dtype = np.float32
+        
+        hour_stop = min(dataset.shape[2], first_hour + n_hours)
+        hours = max(0, hour_stop - first_hour)
+        
+        # Stored as (lat, lon, hour, ...) but returned as (hour, ..., lat, lon),
+        # so every (lat, lon) plane the heatmaps plot is contiguous
+        axes = (2,) + tuple(range(3, dataset.ndim)) + (0, 1)
+        data = np.empty((hours,) + dataset.shape[3:] + dataset.shape[:2], dtype=dtype)
+        if hours == 0:
+            # None of the requested hours is stored: check_data_layout() reports it
+            return data, offsets
+        
+        # float32 keeps about 7 significant digits: for values far from zero,
+        # like surface pressure in Pa (~1e5), that rounds away the decimals of
+        # the errors. Wider data is shifted by one of its values per variable in
+        # float64 first; the heatmaps only show differences, which don't change
+        if offsets is None:
+            offsets = np.zeros(dataset.shape[3:4])
+            if dataset.dtype.itemsize > np.dtype(dtype).itemsize and dataset.ndim > 3:
+                first_values = np.asarray(dataset[0, 0, first_hour], dtype=np.float64)
+                offsets = np.nan_to_num(first_values.reshape(len(first_values), -1)[:, 0])
+        shift = offsets.shape == dataset.shape[3:4] and offsets.any()
+        read_dtype = np.float64 if shift else dtype
+        variable_offsets = offsets.reshape(offsets.shape + (1,) * (dataset.ndim - 4)) if shift else None
+        
+        # Contiguous datasets on disk (never compressed, filters need chunking)
+        # are memory-mapped: the page cache serves the bytes without going
+        # through HDF5's read buffers. In a file read into memory they are
+        # viewed in place, without copying them out of the buffer first
+        offset = dataset.id.get_offset() if dataset.chunks is None else None
+        mapped = None
+        if offset is not None:
+            if isinstance(h5_file, str):
+                mapped = np.memmap(h5_file, dtype=dataset.dtype, mode='r', offset=offset, shape=dataset.shape)
+            elif isinstance(h5_file, io.BytesIO):
+                mapped = np.frombuffer(h5_file.getbuffer(), dtype=dataset.dtype,
+                                       count=int(np.prod(dataset.shape)), offset=offset).reshape(dataset.shape)
+        
+        # Reorder block by block of latitude rows (contiguous in the file), so
+        # only one block is ever held in the file layout next to the result
+        row_size = int(np.prod(dataset.shape[1:2] + (hours,) + dataset.shape[3:]))
+        block_rows = max(1, READ_BLOCK_BYTES // (row_size * np.dtype(read_dtype).itemsize))
+        for start in range(0, dataset.shape[0], block_rows):
+            stop = min(start + block_rows, dataset.shape[0])
+            if mapped is not None:
+                block = mapped[start:stop, :, first_hour:hour_stop]
+                if shift:
+                    block = block - variable_offsets
+            else:
+                # Only these hours are rendered: read that hyperslab
+                # straight into a preallocated buffer
+                block = np.empty((stop - start,) + dataset.shape[1:2] + (hours,) + dataset.shape[3:], dtype=read_dtype)
+                if stop - start == dataset.shape[0] and (first_hour, hour_stop) == (0, dataset.shape[2]):
+                    # Whole dataset needed: read the full dataspace in one call,
+                    # skipping the hyperslab selection
+                    dataset.read_direct(block)
+                else:
+                    dataset.read_direct(block, source_sel=np.s_[start:stop, :, first_hour:hour_stop])
+                if shift:
+                    block -= variable_offsets
+            data[..., start:stop, :] = block.transpose(axes)
+        # Release the file mapping so the extracted directory can be deleted
+        del mapped
+    return data, offsets
+
+def check_data_layout(data_3, era5, first_hour=0, n_hours=N_HOURS):
+    """Check that the forecast and ERA5 arrays have the layout the per-hour views expect.
+
+    Returns a description of the first mismatch, or None if the layout is as expected.
+    """
+    if data_3.ndim != 5 or data_3.shape[1:3] != (len(VARIABLES), len(MODELS)):
+        return (f"api_x.h5 data has shape {data_3.shape} after reading, expected "
+                f"(hour, {len(VARIABLES)}, {len(MODELS)}, lat, lon)")
+    if era5.ndim != 4 or era5.shape[1] != len(VARIABLES) or era5.shape[2:] != data_3.shape[3:]:
+        return (f"y.h5 data has shape {era5.shape} after reading, expected "
+                f"(hour, {len(VARIABLES)}, {data_3.shape[3]}, {data_3.shape[4]})")
+    if min(data_3.shape[0], era5.shape[0]) < n_hours:
+        return f"Expected {N_HOURS} forecast hours, found {first_hour + min(data_3.shape[0], era5.shape[0])}"
     return None
 
 def extract_rar_file(rar_path, extracted_path):
-    """Extract a RAR file to the specified directory."""
-    # Convert to absolute paths
-    rar_path = os.path.abspath(rar_path)
-    extracted_path = os.path.abspath(extracted_path)
-    
-    # Remove existing directory if it exists
-    if os.path.exists(extracted_path):
+    """Extract a RAR file to the specified directory (process_rar_file passes absolute paths)."""
+    # Remove files left over in the directory from an earlier run
+    if os.path.exists(extracted_path) and os.listdir(extracted_path):
         try:
             shutil.rmtree(extracted_path)
         except:
@@ -33,9 +326,11 @@ def extract_rar_file(rar_path, extracted_path):
     
     # Try using rarfile library first
     try:
-        import rarfile
+        rarfile = import_rarfile()
         with rarfile.RarFile(rar_path) as rf:
-            rf.extractall(extracted_path)
+            # Only the HDF5 files are read, skip writing the other members to disk
+            rf.extractall(extracted_path, members=[info for info in rf.infolist()
+                                                   if os.path.basename(info.filename) in H5_FILENAMES])
         print("Extraction complete.")
         return True
     except ImportError:
@@ -46,8 +341,18 @@ def extract_rar_file(rar_path, extracted_path):
         print(f"rarfile library error: {e}")
         print("Trying fallback extraction method...")
     
+    # Fallback: run the bundled unrar directly, so no system-wide install is needed
+    if os.path.isfile(BUNDLED_UNRAR):
+        try:
+            subprocess.run([BUNDLED_UNRAR, 'x', '-y', '-r', UNRAR_THREADS, rar_path, *UNRAR_MASKS, extracted_path + os.sep],
+                         check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            print("Extraction complete.")
+            return True
+        except (subprocess.CalledProcessError, OSError) as e:
+            print(f"Bundled unrar failed: {e}")
+    
     # Fallback: try using WinRAR command line (Windows) or unrar (Linux)
-    if sys.platform == 'win32':
+    if IS_WIN:
         try:
             # Try common WinRAR installation paths
             winrar_paths = [
@@ -62,7 +367,7 @@ def extract_rar_file(rar_path, extracted_path):
             
             if winrar_exe:
                 # Use absolute paths for Windows
-                subprocess.run([winrar_exe, 'x', '-y', rar_path, extracted_path + os.sep], 
+                subprocess.run([winrar_exe, 'x', '-y', '-r', UNRAR_THREADS, rar_path, *UNRAR_MASKS, extracted_path + os.sep], 
                              check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 print("Extraction complete.")
                 return True
@@ -72,12 +377,12 @@ def extract_rar_file(rar_path, extracted_path):
             print(f"Error extracting RAR file: {e}")
             print("Please either:")
             print("1. Install rarfile: pip install rarfile (requires unrar executable)")
-            print("2. Manually extract the RAR file to: " + extracted_path)
+            print("2. Manually extract the RAR file into the data directory")
             return False
     else:
         # Try unrar on Linux/Mac
         try:
-            subprocess.run(['unrar', 'x', '-y', rar_path, extracted_path + os.sep],
+            subprocess.run(['unrar', 'x', '-y', '-r', UNRAR_THREADS, rar_path, *UNRAR_MASKS, extracted_path + os.sep],
                          check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             print("Extraction complete.")
             return True
@@ -85,11 +390,261 @@ def extract_rar_file(rar_path, extracted_path):
             print("Error: rarfile library not installed and unrar not found.")
             print("Please install it with: pip install rarfile")
             print("Or install unrar: sudo apt-get install unrar (Linux) or brew install unrar (Mac)")
-            print("Or manually extract the RAR file to: " + extracted_path)
+            print("Or manually extract the RAR file into the data directory")
             return False
 
-def process_rar_file(rar_path, data_dir, result_dir):
-    """Process a single RAR file: extract, generate heatmap, and clean up."""
+def force_remove(func, path, exc_info):
+    """shutil.rmtree error handler for Windows: clear read-only/hidden/system attributes and retry."""
+    # FILE_ATTRIBUTE_NORMAL; set in-process instead of shelling out to cmd.exe
+    ctypes.windll.kernel32.SetFileAttributesW(path, 0x80)
+    func(path)
+
+def remove_extracted_dir(extracted_path):
+    """Delete an extracted directory, retrying with exponential backoff if files are locked."""
+    if not os.path.exists(extracted_path):
+        return
+    
+    max_retries = 5
+    retry_delay = 0.5  # seconds
+    
+    for attempt in range(max_retries):
+        try:
+            # On Windows, clear file attributes that block deletion and retry
+            if IS_WIN:
+                shutil.rmtree(extracted_path, onerror=force_remove)
+            else:
+                shutil.rmtree(extracted_path)
+            
+            print(f"Cleaned up extracted directory: {extracted_path}")
+            return
+            
+        except PermissionError as e:
+            if attempt < max_retries - 1:
+                import time
+                time.sleep(retry_delay)
+                retry_delay *= 2  # Exponential backoff
+                continue
+            else:
+                # Last attempt: delete whatever can be deleted, skipping locked files
+                try:
+                    shutil.rmtree(extracted_path, ignore_errors=True)
+                    if not os.path.exists(extracted_path):
+                        print(f"Cleaned up extracted directory: {extracted_path}")
+                        return
+                except:
+                    pass
+                print(f"Warning: Could not clean up {extracted_path} after {max_retries} attempts: {e}")
+                print("Directory may be locked by another process. Please delete manually if needed.")
+                
+        except Exception as cleanup_error:
+            if attempt < max_retries - 1:
+                import time
+                time.sleep(retry_delay)
+                retry_delay *= 2
+                continue
+            else:
+                print(f"Warning: Could not clean up {extracted_path} after {max_retries} attempts: {cleanup_error}")
+                print("Directory may be locked by another process. Please delete manually if needed.")
+
+def _cleanup_worker():
+    """Delete the directories queued by schedule_cleanup(), one at a time."""
+    while True:
+        extracted_path = _cleanup_queue.get()
+        try:
+            remove_extracted_dir(extracted_path)
+        finally:
+            _cleanup_queue.task_done()
+
+def schedule_cleanup(extracted_path):
+    """Queue an extracted directory for deletion by the background cleanup thread."""
+    global _cleanup_thread
+    if _cleanup_thread is None:
+        _cleanup_thread = threading.Thread(target=_cleanup_worker, name='cleanup', daemon=True)
+        _cleanup_thread.start()
+        # The thread is a daemon: still delete the queued directories when the
+        # script exits early (error or Ctrl+C) instead of leaving them behind
+        atexit.register(wait_for_cleanup)
+    _cleanup_queue.put(extracted_path)
+
+def wait_for_cleanup():
+    """Block until every queued extracted directory has been deleted."""
+    _cleanup_queue.join()
+
+def create_hour_figure(shape):
+    """Create the 6x6 figure of an hourly PNG with placeholder images, labels and colorbars."""
+    # Use diverging colormap for better contrast
+    cmap = 'RdBu_r'  # or 'coolwarm', 'seismic', 'bwr'
+    
+    # Create figure with 6 rows (features) and 6 columns (models)
+    # Plain Agg figure, not registered with pyplot: it lives as long as this
+    # process reuses it and needs no plt.close()
+    fig = Figure(figsize=(18, 36))
+    FigureCanvasAgg(fig)
+    axes = fig.subplots(6, 6)
+    images = np.empty((6, 6), dtype=object)
+    texts = np.empty((6, 6), dtype=object)
+    placeholder = np.zeros(shape, dtype=np.float32)
+    for row_idx in range(6):
+        # The difference panels of a row share one symmetric color scale
+        diff_norm = Normalize()
+        for col_idx in range(6):
+            ax = axes[row_idx, col_idx]
+            # Second column shows absolute ECMWF RMSE, the others use symmetric color scaling
+            # Data rows run south to north: draw row 0 at the bottom instead of
+            # flipping every array north-up
+            if col_idx == 1:
+                images[row_idx, col_idx] = ax.imshow(placeholder, cmap='viridis', origin='lower')
+            else:
+                images[row_idx, col_idx] = ax.imshow(placeholder, cmap=cmap, norm=diff_norm, origin='lower')
+            ax.axis('off')
+            texts[row_idx, col_idx] = ax.text(0.5, -0.08, '', transform=ax.transAxes,
+                                              ha='center', va='top', fontsize=9)
+        
+        # Add colorbars: one for the ECMWF RMSE and one shared by the difference panels.
+        # Each gets its own inset axes beside the panel, so no panel is shrunk to make room
+        for col_idx in (1, 5):
+            cax = axes[row_idx, col_idx].inset_axes([1.04, 0, 0.05, 1])
+            fig.colorbar(images[row_idx, col_idx], cax=cax)
+    
+    return fig, axes, images, texts
+
+def abs_errors(hour_data):
+    """Absolute errors against ERA5 of every source for every variable.
+
+    Returns an array laid out as (variable, source, lat, lon), with the sources in
+    heatmap column order: the forecast models, then ENS AIFS. The array is a
+    buffer reused for the next hour rendered by this process.
+    """
+    global _error_buffer
+    
+    forecast = hour_data['forecast']
+    shape = (forecast.shape[0], forecast.shape[1] + 1) + forecast.shape[2:]
+    if _error_buffer is None or _error_buffer.shape != shape:
+        _error_buffer = np.empty(shape, dtype=np.float32)
+    
+    # One array holding all sources, so the error is a single broadcast
+    # operation computed in place instead of one temporary per model and variable
+    errors = np.concatenate([forecast, hour_data['ens_aifs'][:, None]], axis=1, out=_error_buffer)
+    np.subtract(errors, hour_data['era5'][:, None], out=errors)
+    np.abs(errors, out=errors)
+    return errors
+
+def render_hour(hour, hour_data, output_path):
+    """Render the RMSE comparison heatmaps of one forecast hour and save them as a PNG file.
+
+    hour_data holds the hour's forecast (variable, model, lat, lon), era5 and
+    ens_aifs (variable, lat, lon) arrays.
+    """
+    global _hour_figure
+    
+    # Reuse the figure of the previous hour rendered by this process: only the
+    # image data, color limits and labels change between hours
+    shape = hour_data['era5'].shape[1:]
+    new_figure = _hour_figure is None or _hour_figure[0] != shape
+    if new_figure:
+        _hour_figure = (shape,) + create_hour_figure(shape)
+    _, fig, axes, images, texts = _hour_figure
+    
+    # Calculate RMSE for each model and feature at once
+    errors = abs_errors(hour_data)
+    
+    # Global RMSE of every source and feature in one reduction, as (feature, source);
+    # float64 accumulation keeps large grids accurate without a squared temporary
+    global_rmses = np.sqrt(np.einsum('vshw,vshw->vs', errors, errors, dtype=np.float64)
+                          / (errors.shape[2] * errors.shape[3]))
+    
+    # Express the other sources relative to ECMWF, in place: their absolute
+    # errors are not needed on their own any more
+    ecmwf_error = errors[:, ECMWF_IDX:ECMWF_IDX + 1]
+    errors[:, :ECMWF_IDX] -= ecmwf_error
+    errors[:, ECMWF_IDX + 1:] -= ecmwf_error
+    ecmwf_rmse = global_rmses[:, ECMWF_IDX:ECMWF_IDX + 1].copy()
+    global_rmses[:, :ECMWF_IDX] -= ecmwf_rmse
+    global_rmses[:, ECMWF_IDX + 1:] -= ecmwf_rmse
+    
+    # Symmetric color limit of each feature: the largest absolute difference over
+    # the compared sources, from one max and one min reduction over all panels
+    # (ignoring the NaN panels of a missing ENS AIFS)
+    extents = np.maximum(errors.max(axis=(2, 3)), -errors.min(axis=(2, 3)))
+    extents[:, ECMWF_IDX] = 0
+    vmaxes = np.nanmax(extents, axis=1)
+    
+    # Process each feature for this hour: all arithmetic is done above, the
+    # panels only receive their slice of the error array
+    for row_idx, feature_name in enumerate(FEATURE_NAMES):
+        for col_idx, label in enumerate(PANEL_LABELS):
+            image = images[row_idx, col_idx]
+            image.set_data(errors[row_idx, col_idx])
+            axes[row_idx, col_idx].set_title(f'{feature_name} ({hour})\n{label}')
+            texts[row_idx, col_idx].set_text(f'Global RMSE: {global_rmses[row_idx, col_idx]:.4f}')
+        
+        # Second plot shows absolute ECMWF RMSE; the difference panels share one
+        # symmetric color scale, so setting it on one panel sets it on all of them
+        images[row_idx, 1].autoscale()
+        images[row_idx, 0].set_clim(-vmaxes[row_idx], vmaxes[row_idx])
+    
+    # Lay out a new figure once; repeating it on a reused figure shrinks the panels
+    if new_figure:
+        fig.tight_layout(rect=[0, 0.03, 1, 0.98])  # Leave space at bottom for global RMSE text
+        fig.subplots_adjust(bottom=0.05)  # Additional bottom margin for text
+    
+    # Save the PNG file for this hour
+    try:
+        # Ensure output directory exists
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        fig.savefig(output_path, dpi=300, bbox_inches='tight',
+                    pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+    except Exception as e:
+        print(f"Error saving PNG file {output_path}: {e}")
+        raise
+    
+    return output_path
+
+def iter_hours(forecast, era5, ens_aifs, first_hour=0):
+    """Yield (hour name, hour data) for each forecast hour, one hour at a time.
+
+    forecast is laid out as (hour, variable, model, lat, lon), era5 and ens_aifs as
+    (hour, variable, lat, lon). The hour data holds views into these arrays, so an
+    hour's bundle can be dropped as soon as its PNG is written. The arrays start
+    at forecast hour first_hour.
+    """
+    for hour_idx, hour in enumerate(HOURS[first_hour:first_hour + forecast.shape[0]]):
+        hour_data = {
+            'forecast': forecast[hour_idx],
+            'era5': era5[hour_idx],
+            'ens_aifs': ens_aifs[hour_idx]
+        }
+        yield hour, hour_data
+
+def list_files(directory):
+    """Return the set of file names in a directory, or None if it does not exist."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return None
+
+def prefetch_h5_members(rar_path, data_dir, result_dir):
+    """Read the HDF5 members of a RAR file ahead of process_rar_file().
+
+    Returns None when process_rar_file() will not read them from the archive:
+    all of its PNG files exist, or it was extracted manually into the data directory.
+    """
+    rar_basename = os.path.splitext(os.path.basename(rar_path))[0]
+    existing_files = list_files(os.path.join(result_dir, rar_basename))
+    if existing_files is not None and {f'{rar_basename}_{hour}.png' for hour in HOURS} <= existing_files:
+        return None
+    if os.path.isdir(os.path.join(data_dir, rar_basename)):
+        return None
+    return read_rar_h5_members(rar_path, H5_FILENAMES)
+
+def process_rar_file(rar_path, data_dir, result_dir, executor=None, prefetched=None):
+    """Process a single RAR file: extract, generate heatmap, and clean up.
+
+    The hourly PNG files are rendered by the worker processes of `executor`
+    when one is given, otherwise in this process. `prefetched` is an optional
+    future of prefetch_h5_members() for this RAR file.
+    """
     print(f"\n{'='*60}")
     print(f"Processing: {os.path.basename(rar_path)}")
     print(f"{'='*60}")
@@ -99,89 +654,39 @@ def process_rar_file(rar_path, data_dir, result_dir):
     data_dir = os.path.abspath(data_dir)
     result_dir = os.path.abspath(result_dir)
     
-    # Determine extracted path based on RAR filename (in data directory)
+    # A folder named after the RAR file in the data directory holds files the
+    # user extracted manually; automatic extraction goes to a temporary directory
     rar_basename = os.path.splitext(os.path.basename(rar_path))[0]
     extracted_path = os.path.join(data_dir, rar_basename)
-    fig = None
     
-    # Create subdirectory for this RAR file in result directory
+    # Subdirectory for this RAR file in result directory
     rar_output_dir = os.path.join(result_dir, rar_basename)
-    os.makedirs(rar_output_dir, exist_ok=True)
     
-    # Check if all PNG files already exist (one per day: 1d, 2d, 3d, 4d, 5d)
-    all_pngs_exist = True
-    for day in ['1d', '2d', '3d', '4d', '5d']:
-        png_path = os.path.join(rar_output_dir, f'{rar_basename}_{day}.png')
-        if not os.path.exists(png_path):
-            all_pngs_exist = False
-            break
+    # List the output directory once instead of checking each PNG file separately
+    existing_files = list_files(rar_output_dir)
     
-    if all_pngs_exist:
+    # Check if all PNG files already exist (one per forecast hour: 1h ... 24h)
+    # before anything is extracted or loaded
+    expected_files = {f'{rar_basename}_{hour}.png' for hour in HOURS}
+    if existing_files is not None and expected_files <= existing_files:
         print(f"All PNG files already exist for {rar_basename}")
         print("Skipping processing for this RAR file.")
         return True
     
+    # Only the hours from the first to the last missing PNG file are read
+    missing_hours = [hour_idx for hour_idx, hour in enumerate(HOURS)
+                     if f'{rar_basename}_{hour}.png' not in (existing_files or ())]
+    first_hour = missing_hours[0]
+    n_hours = missing_hours[-1] - first_hour + 1
+    
+    # Create subdirectory for this RAR file in result directory
+    if existing_files is None:
+        os.makedirs(rar_output_dir, exist_ok=True)
+    
     def cleanup_extracted_files():
-        """Helper function to clean up extracted files with retry logic."""
-        if not os.path.exists(extracted_path):
-            return
-        
-        max_retries = 5
-        retry_delay = 0.5  # seconds
-        
-        for attempt in range(max_retries):
-            try:
-                # On Windows, try to remove read-only files first
-                if sys.platform == 'win32':
-                    import stat
-                    def remove_readonly(func, path, exc):
-                        try:
-                            os.chmod(path, stat.S_IWRITE)
-                            func(path)
-                        except:
-                            pass
-                    
-                    shutil.rmtree(extracted_path, onerror=remove_readonly)
-                else:
-                    shutil.rmtree(extracted_path)
-                
-                print(f"Cleaned up extracted directory: {extracted_path}")
-                return
-                
-            except PermissionError as e:
-                if attempt < max_retries - 1:
-                    import time
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                    continue
-                else:
-                    # Last attempt: try more aggressive cleanup
-                    try:
-                        if sys.platform == 'win32':
-                            # Try using Windows command to force delete
-                            subprocess.run(['cmd', '/c', 'rmdir', '/s', '/q', extracted_path], 
-                                         check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
-                        else:
-                            # Try using rm -rf on Linux/Mac
-                            subprocess.run(['rm', '-rf', extracted_path], 
-                                         check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
-                        if not os.path.exists(extracted_path):
-                            print(f"Cleaned up extracted directory: {extracted_path}")
-                            return
-                    except:
-                        pass
-                    print(f"Warning: Could not clean up {extracted_path} after {max_retries} attempts: {e}")
-                    print("Directory may be locked by another process. Please delete manually if needed.")
-                    
-            except Exception as cleanup_error:
-                if attempt < max_retries - 1:
-                    import time
-                    time.sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-                else:
-                    print(f"Warning: Could not clean up {extracted_path} after {max_retries} attempts: {cleanup_error}")
-                    print("Directory may be locked by another process. Please delete manually if needed.")
+        """Helper function to delete the extracted files in the background."""
+        if os.path.exists(extracted_path):
+            schedule_cleanup(extracted_path)
     
     try:
         # Check if RAR file exists
@@ -191,19 +696,44 @@ def process_rar_file(rar_path, data_dir, result_dir):
             return False
         
         # Check if required files exist (handle case where h5 files are in a subdirectory)
-        api_x_path = find_h5_file(extracted_path, 'api_x.h5') if os.path.exists(extracted_path) else None
-        y_path = find_h5_file(extracted_path, 'y.h5') if os.path.exists(extracted_path) else None
+        h5_paths = find_h5_files(extracted_path, H5_FILENAMES) if os.path.isdir(extracted_path) else {}
+        api_x_path = h5_paths.get('api_x.h5')
+        y_path = h5_paths.get('y.h5')
         
-        # Extract if directory doesn't exist or required files are missing
+        # Otherwise read the HDF5 files straight out of the archive, so they are
+        # never written to (and deleted from) disk
+        h5_members = {}
         if not api_x_path or not y_path:
+            # Use the members already read by the prefetch thread if there are any
+            h5_members = prefetched.result() if prefetched is not None else None
+            if h5_members is None:
+                h5_members = read_rar_h5_members(rar_path, H5_FILENAMES)
+        
+        # HDF5 files are opened either from their path or from an in-memory buffer
+        if 'api_x.h5' in h5_members and 'y.h5' in h5_members:
+            api_x_path, api_x_file = h5_members['api_x.h5']
+            y_path, y_file = h5_members['y.h5']
+            print(f"Read api_x.h5 and y.h5 from {rar_path} into memory")
+        
+        # Extract if directory doesn't exist or required files are missing
+        elif not api_x_path or not y_path:
+            h5_members = {}
+            # Extract into a fresh temporary directory next to the RAR file,
+            # deleted again by cleanup_extracted_files(). Archives only get here
+            # when they are too large to read into memory, so they are not put
+            # in the system temp directory (often RAM-backed or on a small drive)
+            manual_path = extracted_path
+            extracted_path = tempfile.mkdtemp(prefix=rar_basename + '_', dir=data_dir)
             if not extract_rar_file(rar_path, extracted_path):
                 print(f"Skipping {rar_path} due to extraction error.")
+                print(f"To process it anyway, extract it manually to: {manual_path}")
                 cleanup_extracted_files()
                 return False
             
             # Find the files after extraction (recursively search in subdirectories)
-            api_x_path = find_h5_file(extracted_path, 'api_x.h5')
-            y_path = find_h5_file(extracted_path, 'y.h5')
+            h5_paths = find_h5_files(extracted_path, H5_FILENAMES)
+            api_x_path = h5_paths.get('api_x.h5')
+            y_path = h5_paths.get('y.h5')
             
             if not api_x_path or not y_path:
                 # Print directory structure for debugging
@@ -225,31 +755,14 @@ def process_rar_file(rar_path, data_dir, result_dir):
             # Print where files were found (helpful for debugging)
             print(f"Found api_x.h5 at: {api_x_path}")
             print(f"Found y.h5 at: {y_path}")
+            api_x_file, y_file = api_x_path, y_path
+        
+        else:
+            api_x_file, y_file = api_x_path, y_path
 
         # Load data from HDF5 files
         try:
-            # Check if file exists and is readable
-            if not os.path.exists(api_x_path):
-                raise FileNotFoundError(f"HDF5 file not found: {api_x_path}")
-            
-            # Check file size (HDF5 files should be at least a few bytes)
-            file_size = os.path.getsize(api_x_path)
-            if file_size == 0:
-                raise ValueError(f"HDF5 file is empty: {api_x_path}")
-            
-            with h5py.File(api_x_path, 'r') as f:
-                # Try common dataset names, or use the first available dataset
-                if 'data' in f:
-                    data_3 = np.array(f['data'])
-                elif 'dataset' in f:
-                    data_3 = np.array(f['dataset'])
-                else:
-                    # Use the first dataset found
-                    keys = list(f.keys())
-                    if keys:
-                        data_3 = np.array(f[keys[0]])
-                    else:
-                        raise ValueError("No datasets found in HDF5 file")
+            data_3, offsets = read_h5_dataset(api_x_file, first_hour, n_hours)
 
         except (OSError, IOError) as e:
             print(f"Error reading HDF5 file {api_x_path}: {e}")
@@ -263,164 +776,10 @@ def process_rar_file(rar_path, data_dir, result_dir):
             cleanup_extracted_files()
             return False
 
-        # data_3[:,:,:,4,:] *= 1000
-        
-        best_match, ecmwf_ifs, gfs_global, AIFS, CMA = np.split(data_3, 5, axis = -1)
-        best_match = best_match.squeeze(axis = -1)
-        ecmwf_ifs = ecmwf_ifs.squeeze(axis = -1)
-        gfs_global = gfs_global.squeeze(axis = -1)
-        AIFS = AIFS.squeeze(axis = -1)
-        CMA = CMA.squeeze(axis = -1)
+        # data_3[:, 4] *= 1000
         
-
-        best_match_1h = best_match[:,:,0,:]
-        best_match_2h = best_match[:,:,1,:]
-        best_match_3h = best_match[:,:,2,:]
-        best_match_4h = best_match[:,:,3,:]
-        best_match_5h = best_match[:,:,4,:]
-        best_match_6h = best_match[:,:,5,:]
-        best_match_7h = best_match[:,:,6,:]
-        best_match_8h = best_match[:,:,7,:]
-        best_match_9h = best_match[:,:,8,:]
-        best_match_10h = best_match[:,:,9,:]
-        best_match_11h = best_match[:,:,10,:]
-        best_match_12h = best_match[:,:,11,:]
-        best_match_13h = best_match[:,:,12,:]
-        best_match_14h = best_match[:,:,13,:]
-        best_match_15h = best_match[:,:,14,:]
-        best_match_16h = best_match[:,:,15,:]
-        best_match_17h = best_match[:,:,16,:]
-        best_match_18h = best_match[:,:,17,:]
-        best_match_19h = best_match[:,:,18,:]
-        best_match_20h = best_match[:,:,19,:]
-        best_match_21h = best_match[:,:,20,:]
-        best_match_22h = best_match[:,:,21,:]
-        best_match_23h = best_match[:,:,22,:]
-        best_match_24h = best_match[:,:,23,:]
-
-        ecmwf_ifs_1h = ecmwf_ifs[:,:,0,:]
-        ecmwf_ifs_2h = ecmwf_ifs[:,:,1,:]
-        ecmwf_ifs_3h = ecmwf_ifs[:,:,2,:]
-        ecmwf_ifs_4h = ecmwf_ifs[:,:,3,:]
-        ecmwf_ifs_5h = ecmwf_ifs[:,:,4,:]
-        ecmwf_ifs_6h = ecmwf_ifs[:,:,5,:]
-        ecmwf_ifs_7h = ecmwf_ifs[:,:,6,:]
-        ecmwf_ifs_8h = ecmwf_ifs[:,:,7,:]
-        ecmwf_ifs_9h = ecmwf_ifs[:,:,8,:]
-        ecmwf_ifs_10h = ecmwf_ifs[:,:,9,:]
-        ecmwf_ifs_11h = ecmwf_ifs[:,:,10,:]
-        ecmwf_ifs_12h = ecmwf_ifs[:,:,11,:]
-        ecmwf_ifs_13h = ecmwf_ifs[:,:,12,:]
-        ecmwf_ifs_14h = ecmwf_ifs[:,:,13,:]
-        ecmwf_ifs_15h = ecmwf_ifs[:,:,14,:]
-        ecmwf_ifs_16h = ecmwf_ifs[:,:,15,:]
-        ecmwf_ifs_17h = ecmwf_ifs[:,:,16,:]
-        ecmwf_ifs_18h = ecmwf_ifs[:,:,17,:]
-        ecmwf_ifs_19h = ecmwf_ifs[:,:,18,:]
-        ecmwf_ifs_20h = ecmwf_ifs[:,:,19,:]
-        ecmwf_ifs_21h = ecmwf_ifs[:,:,20,:]
-        ecmwf_ifs_22h = ecmwf_ifs[:,:,21,:]
-        ecmwf_ifs_23h = ecmwf_ifs[:,:,22,:]
-        ecmwf_ifs_24h = ecmwf_ifs[:,:,23,:]
-
-        gfs_global_1h = gfs_global[:,:,0,:]
-        gfs_global_2h = gfs_global[:,:,1,:]
-        gfs_global_3h = gfs_global[:,:,2,:]
-        gfs_global_4h = gfs_global[:,:,3,:]
-        gfs_global_5h = gfs_global[:,:,4,:]
-        gfs_global_6h = gfs_global[:,:,5,:]
-        gfs_global_7h = gfs_global[:,:,6,:]
-        gfs_global_8h = gfs_global[:,:,7,:]
-        gfs_global_9h = gfs_global[:,:,8,:]
-        gfs_global_10h = gfs_global[:,:,9,:]
-        gfs_global_11h = gfs_global[:,:,10,:]
-        gfs_global_12h = gfs_global[:,:,11,:]
-        gfs_global_13h = gfs_global[:,:,12,:]
-        gfs_global_14h = gfs_global[:,:,13,:]
-        gfs_global_15h = gfs_global[:,:,14,:]
-        gfs_global_16h = gfs_global[:,:,15,:]
-        gfs_global_17h = gfs_global[:,:,16,:]
-        gfs_global_18h = gfs_global[:,:,17,:]
-        gfs_global_19h = gfs_global[:,:,18,:]
-        gfs_global_20h = gfs_global[:,:,19,:]
-        gfs_global_21h = gfs_global[:,:,20,:]
-        gfs_global_22h = gfs_global[:,:,21,:]
-        gfs_global_23h = gfs_global[:,:,22,:]
-        gfs_global_24h = gfs_global[:,:,23,:]
-
-        AIFS_1h = AIFS[:,:,0,:]
-        AIFS_2h = AIFS[:,:,1,:]
-        AIFS_3h = AIFS[:,:,2,:]
-        AIFS_4h = AIFS[:,:,3,:]
-        AIFS_5h = AIFS[:,:,4,:]
-        AIFS_6h = AIFS[:,:,5,:]
-        AIFS_7h = AIFS[:,:,6,:]
-        AIFS_8h = AIFS[:,:,7,:]
-        AIFS_9h = AIFS[:,:,8,:]
-        AIFS_10h = AIFS[:,:,9,:]
-        AIFS_11h = AIFS[:,:,10,:]
-        AIFS_12h = AIFS[:,:,11,:]
-        AIFS_13h = AIFS[:,:,12,:]
-        AIFS_14h = AIFS[:,:,13,:]
-        AIFS_15h = AIFS[:,:,14,:]
-        AIFS_16h = AIFS[:,:,15,:]
-        AIFS_17h = AIFS[:,:,16,:]
-        AIFS_18h = AIFS[:,:,17,:]
-        AIFS_19h = AIFS[:,:,18,:]
-        AIFS_20h = AIFS[:,:,19,:]
-        AIFS_21h = AIFS[:,:,20,:]
-        AIFS_22h = AIFS[:,:,21,:]
-        AIFS_23h = AIFS[:,:,22,:]
-        AIFS_24h = AIFS[:,:,23,:]
-
-        CMA_1h = CMA[:,:,0,:]
-        CMA_2h = CMA[:,:,1,:]
-        CMA_3h = CMA[:,:,2,:]
-        CMA_4h = CMA[:,:,3,:]
-        CMA_5h = CMA[:,:,4,:]
-        CMA_6h = CMA[:,:,5,:]
-        CMA_7h = CMA[:,:,6,:]
-        CMA_8h = CMA[:,:,7,:]
-        CMA_9h = CMA[:,:,8,:]
-        CMA_10h = CMA[:,:,9,:]
-        CMA_11h = CMA[:,:,10,:]
-        CMA_12h = CMA[:,:,11,:]
-        CMA_13h = CMA[:,:,12,:]
-        CMA_14h = CMA[:,:,13,:]
-        CMA_15h = CMA[:,:,14,:]
-        CMA_16h = CMA[:,:,15,:]
-        CMA_17h = CMA[:,:,16,:]
-        CMA_18h = CMA[:,:,17,:]
-        CMA_19h = CMA[:,:,18,:]
-        CMA_20h = CMA[:,:,19,:]
-        CMA_21h = CMA[:,:,20,:]
-        CMA_22h = CMA[:,:,21,:]
-        CMA_23h = CMA[:,:,22,:]
-        CMA_24h = CMA[:,:,23,:]
-
         try:
-            # Check if file exists and is readable
-            if not os.path.exists(y_path):
-                raise FileNotFoundError(f"HDF5 file not found: {y_path}")
-            
-            # Check file size (HDF5 files should be at least a few bytes)
-            file_size = os.path.getsize(y_path)
-            if file_size == 0:
-                raise ValueError(f"HDF5 file is empty: {y_path}")
-            
-            with h5py.File(y_path, 'r') as f:
-                # Try common dataset names, or use the first available dataset
-                if 'data' in f:
-                    era5 = np.array(f['data'])
-                elif 'dataset' in f:
-                    era5 = np.array(f['dataset'])
-                else:
-                    # Use the first dataset found
-                    keys = list(f.keys())
-                    if keys:
-                        era5 = np.array(f[keys[0]])
-                    else:
-                        raise ValueError("No datasets found in HDF5 file")
+            era5, _ = read_h5_dataset(y_file, first_hour, n_hours, offsets)
         except (OSError, IOError) as e:
             print(f"Error reading HDF5 file {y_path}: {e}")
             print("The file may be corrupted, truncated, or incomplete.")
@@ -433,34 +792,25 @@ def process_rar_file(rar_path, data_dir, result_dir):
             cleanup_extracted_files()
             return False
         
+        # The per-hour views below index the arrays directly, so check their
+        # layout once instead of failing halfway through the hours
+        layout_error = check_data_layout(data_3, era5, first_hour, n_hours)
+        if layout_error:
+            print(f"Error: {layout_error}")
+            print("Skipping this RAR file.")
+            cleanup_extracted_files()
+            return False
+        
         # Find and load z.h5 into ens_aifs (same way as era5 from y.h5)
-        z_path = find_h5_file(extracted_path, 'z.h5')
+        if 'z.h5' in h5_members:
+            z_path, z_file = h5_members['z.h5']
+        else:
+            z_path = z_file = h5_paths.get('z.h5')
         ens_aifs = None
         
         if z_path:
             try:
-                # Check if file exists and is readable
-                if not os.path.exists(z_path):
-                    raise FileNotFoundError(f"HDF5 file not found: {z_path}")
-                
-                # Check file size (HDF5 files should be at least a few bytes)
-                file_size = os.path.getsize(z_path)
-                if file_size == 0:
-                    raise ValueError(f"HDF5 file is empty: {z_path}")
-                
-                with h5py.File(z_path, 'r') as f:
-                    # Try common dataset names, or use the first available dataset
-                    if 'data' in f:
-                        ens_aifs = np.array(f['data'])
-                    elif 'dataset' in f:
-                        ens_aifs = np.array(f['dataset'])
-                    else:
-                        # Use the first dataset found
-                        keys = list(f.keys())
-                        if keys:
-                            ens_aifs = np.array(f[keys[0]])
-                        else:
-                            raise ValueError("No datasets found in HDF5 file")
+                ens_aifs, _ = read_h5_dataset(z_file, first_hour, n_hours, offsets)
                 
                 print(f"Successfully loaded ens_aifs data from: {z_path}")
             except (OSError, IOError) as e:
@@ -473,1655 +823,90 @@ def process_rar_file(rar_path, data_dir, result_dir):
                 print("Continuing without ens_aifs data.")
                 ens_aifs = None
         else:
-            print(f"Warning: z.h5 file not found in {extracted_path}")
+            print(f"Warning: z.h5 file not found in {rar_path if h5_members else extracted_path}")
             print("Continuing without ens_aifs data.")
-
-        ens_aifs = ens_aifs.squeeze(axis = -1)
-        era5_1h = era5[:,:,0,:]
-        era5_2h = era5[:,:,1,:]
-        era5_3h = era5[:,:,2,:]
-        era5_4h = era5[:,:,3,:]
-        era5_5h = era5[:,:,4,:]
-        era5_6h = era5[:,:,5,:]
-        era5_7h = era5[:,:,6,:]
-        era5_8h = era5[:,:,7,:]
-        era5_9h = era5[:,:,8,:]
-        era5_10h = era5[:,:,9,:]
-        era5_11h = era5[:,:,10,:]
-        era5_12h = era5[:,:,11,:]
-        era5_13h = era5[:,:,12,:]
-        era5_14h = era5[:,:,13,:]
-        era5_15h = era5[:,:,14,:]
-        era5_16h = era5[:,:,15,:]
-        era5_17h = era5[:,:,16,:]
-        era5_18h = era5[:,:,17,:]
-        era5_19h = era5[:,:,18,:]
-        era5_20h = era5[:,:,19,:]
-        era5_21h = era5[:,:,20,:]
-        era5_22h = era5[:,:,21,:]
-        era5_23h = era5[:,:,22,:]
-        era5_24h = era5[:,:,23,:]
-
-        ens_aifs_1h = ens_aifs[:,:,0,:]
-        ens_aifs_2h = ens_aifs[:,:,1,:]
-        ens_aifs_3h = ens_aifs[:,:,2,:]
-        ens_aifs_4h = ens_aifs[:,:,3,:]
-        ens_aifs_5h = ens_aifs[:,:,4,:]
-        ens_aifs_6h = ens_aifs[:,:,5,:]
-        ens_aifs_7h = ens_aifs[:,:,6,:]
-        ens_aifs_8h = ens_aifs[:,:,7,:]
-        ens_aifs_9h = ens_aifs[:,:,8,:]
-        ens_aifs_10h = ens_aifs[:,:,9,:]
-        ens_aifs_11h = ens_aifs[:,:,10,:]
-        ens_aifs_12h = ens_aifs[:,:,11,:]
-        ens_aifs_13h = ens_aifs[:,:,12,:]
-        ens_aifs_14h = ens_aifs[:,:,13,:]
-        ens_aifs_15h = ens_aifs[:,:,14,:]
-        ens_aifs_16h = ens_aifs[:,:,15,:]
-        ens_aifs_17h = ens_aifs[:,:,16,:]
-        ens_aifs_18h = ens_aifs[:,:,17,:]
-        ens_aifs_19h = ens_aifs[:,:,18,:]
-        ens_aifs_20h = ens_aifs[:,:,19,:]
-        ens_aifs_21h = ens_aifs[:,:,20,:]
-        ens_aifs_22h = ens_aifs[:,:,21,:]
-        ens_aifs_23h = ens_aifs[:,:,22,:]
-        ens_aifs_24h = ens_aifs[:,:,23,:]
-
-        best_match_1h_2t = best_match_1h[:, :, 0]
-        best_match_1h_2d = best_match_1h[:, :, 1]
-        best_match_1h_100u = best_match_1h[:, :, 2]
-        best_match_1h_100v = best_match_1h[:, :, 3]
-        best_match_1h_tp = best_match_1h[:, :, 4]
-        best_match_1h_sp = best_match_1h[:, :, 5]
-
-        best_match_2h_2t = best_match_2h[:, :, 0]
-        best_match_2h_2d = best_match_2h[:, :, 1]
-        best_match_2h_100u = best_match_2h[:, :, 2]
-        best_match_2h_100v = best_match_2h[:, :, 3]
-        best_match_2h_tp = best_match_2h[:, :, 4]
-        best_match_2h_sp = best_match_2h[:, :, 5]
-
-
-        best_match_3h_2t = best_match_3h[:, :, 0]
-        best_match_3h_2d = best_match_3h[:, :, 1]
-        best_match_3h_100u = best_match_3h[:, :, 2]
-        best_match_3h_100v = best_match_3h[:, :, 3]
-        best_match_3h_tp = best_match_3h[:, :, 4]
-        best_match_3h_sp = best_match_3h[:, :, 5]
-
-        best_match_4h_2t = best_match_4h[:, :, 0]
-        best_match_4h_2d = best_match_4h[:, :, 1]
-        best_match_4h_100u = best_match_4h[:, :, 2]
-        best_match_4h_100v = best_match_4h[:, :, 3]
-        best_match_4h_tp = best_match_4h[:, :, 4]
-        best_match_4h_sp = best_match_4h[:, :, 5]
-
-        best_match_5h_2t = best_match_5h[:, :, 0]
-        best_match_5h_2d = best_match_5h[:, :, 1]
-        best_match_5h_100u = best_match_5h[:, :, 2]
-        best_match_5h_100v = best_match_5h[:, :, 3]
-        best_match_5h_tp = best_match_5h[:, :, 4]
-        best_match_5h_sp = best_match_5h[:, :, 5]
-
-        best_match_6h_2t = best_match_6h[:, :, 0]
-        best_match_6h_2d = best_match_6h[:, :, 1]
-        best_match_6h_100u = best_match_6h[:, :, 2]
-        best_match_6h_100v = best_match_6h[:, :, 3]
-        best_match_6h_tp = best_match_6h[:, :, 4]
-        best_match_6h_sp = best_match_6h[:, :, 5]
-
-        best_match_7h_2t = best_match_7h[:, :, 0]
-        best_match_7h_2d = best_match_7h[:, :, 1]
-        best_match_7h_100u = best_match_7h[:, :, 2]
-        best_match_7h_100v = best_match_7h[:, :, 3]
-        best_match_7h_tp = best_match_7h[:, :, 4]
-        best_match_7h_sp = best_match_7h[:, :, 5]
-
-        best_match_8h_2t = best_match_8h[:, :, 0]
-        best_match_8h_2d = best_match_8h[:, :, 1]
-        best_match_8h_100u = best_match_8h[:, :, 2]
-        best_match_8h_100v = best_match_8h[:, :, 3]
-        best_match_8h_tp = best_match_8h[:, :, 4]
-        best_match_8h_sp = best_match_8h[:, :, 5]
-
-        best_match_9h_2t = best_match_9h[:, :, 0]
-        best_match_9h_2d = best_match_9h[:, :, 1]
-        best_match_9h_100u = best_match_9h[:, :, 2]
-        best_match_9h_100v = best_match_9h[:, :, 3]
-        best_match_9h_tp = best_match_9h[:, :, 4]
-        best_match_9h_sp = best_match_9h[:, :, 5]
-
-        best_match_10h_2t = best_match_10h[:, :, 0]
-        best_match_10h_2d = best_match_10h[:, :, 1]
-        best_match_10h_100u = best_match_10h[:, :, 2]
-        best_match_10h_100v = best_match_10h[:, :, 3]
-        best_match_10h_tp = best_match_10h[:, :, 4]
-        best_match_10h_sp = best_match_10h[:, :, 5]
-        
-        best_match_11h_2t = best_match_11h[:, :, 0]
-        best_match_11h_2d = best_match_11h[:, :, 1]
-        best_match_11h_100u = best_match_11h[:, :, 2]
-        best_match_11h_100v = best_match_11h[:, :, 3]
-        best_match_11h_tp = best_match_11h[:, :, 4]
-        best_match_11h_sp = best_match_11h[:, :, 5]
-        
-        best_match_12h_2t = best_match_12h[:, :, 0]
-        best_match_12h_2d = best_match_12h[:, :, 1]
-        best_match_12h_100u = best_match_12h[:, :, 2]
-        best_match_12h_100v = best_match_12h[:, :, 3]
-        best_match_12h_tp = best_match_12h[:, :, 4]
-        best_match_12h_sp = best_match_12h[:, :, 5]
-        
-        
-        best_match_13h_2t = best_match_13h[:, :, 0]
-        best_match_13h_2d = best_match_13h[:, :, 1]
-        best_match_13h_100u = best_match_13h[:, :, 2]
-        best_match_13h_100v = best_match_13h[:, :, 3]
-        best_match_13h_tp = best_match_13h[:, :, 4]
-        best_match_13h_sp = best_match_13h[:, :, 5]
-        
-
-        best_match_14h_2t = best_match_14h[:, :, 0]
-        best_match_14h_2d = best_match_14h[:, :, 1]
-        best_match_14h_100u = best_match_14h[:, :, 2]
-        best_match_14h_100v = best_match_14h[:, :, 3]
-        best_match_14h_tp = best_match_14h[:, :, 4]
-        best_match_14h_sp = best_match_14h[:, :, 5]
-        
-        best_match_15h_2t = best_match_15h[:, :, 0]
-        best_match_15h_2d = best_match_15h[:, :, 1]
-        best_match_15h_100u = best_match_15h[:, :, 2]
-        best_match_15h_100v = best_match_15h[:, :, 3]
-        best_match_15h_tp = best_match_15h[:, :, 4]
-        best_match_15h_sp = best_match_15h[:, :, 5]
-        
-
-        best_match_16h_2t = best_match_16h[:, :, 0]
-        best_match_16h_2d = best_match_16h[:, :, 1]
-        best_match_16h_100u = best_match_16h[:, :, 2]
-        best_match_16h_100v = best_match_16h[:, :, 3]
-        best_match_16h_tp = best_match_16h[:, :, 4]
-        best_match_16h_sp = best_match_16h[:, :, 5]
-        
-
-        best_match_17h_2t = best_match_17h[:, :, 0]
-        best_match_17h_2d = best_match_17h[:, :, 1]
-        best_match_17h_100u = best_match_17h[:, :, 2]
-        best_match_17h_100v = best_match_17h[:, :, 3]
-        best_match_17h_tp = best_match_17h[:, :, 4]
-        best_match_17h_sp = best_match_17h[:, :, 5]
-        
-
-        best_match_18h_2t = best_match_18h[:, :, 0]
-        best_match_18h_2d = best_match_18h[:, :, 1]
-        best_match_18h_100u = best_match_18h[:, :, 2]
-        best_match_18h_100v = best_match_18h[:, :, 3]
-        best_match_18h_tp = best_match_18h[:, :, 4]
-        best_match_18h_sp = best_match_18h[:, :, 5]
-        
-        best_match_19h_2t = best_match_19h[:, :, 0]
-        best_match_19h_2d = best_match_19h[:, :, 1]
-        best_match_19h_100u = best_match_19h[:, :, 2]
-        best_match_19h_100v = best_match_19h[:, :, 3]
-        best_match_19h_tp = best_match_19h[:, :, 4]
-        best_match_19h_sp = best_match_19h[:, :, 5]
-        
-        best_match_20h_2t = best_match_20h[:, :, 0]
-        best_match_20h_2d = best_match_20h[:, :, 1]
-        best_match_20h_100u = best_match_20h[:, :, 2]
-        best_match_20h_100v = best_match_20h[:, :, 3]
-        best_match_20h_tp = best_match_20h[:, :, 4]
-        best_match_20h_sp = best_match_20h[:, :, 5]
-        
-        best_match_21h_2t = best_match_21h[:, :, 0]
-        best_match_21h_2d = best_match_21h[:, :, 1]
-        best_match_21h_100u = best_match_21h[:, :, 2]
-        best_match_21h_100v = best_match_21h[:, :, 3]
-        best_match_21h_tp = best_match_21h[:, :, 4]
-        best_match_21h_sp = best_match_21h[:, :, 5]
-        
-        best_match_22h_2t = best_match_22h[:, :, 0]
-        best_match_22h_2d = best_match_22h[:, :, 1]
-        best_match_22h_100u = best_match_22h[:, :, 2]
-        best_match_22h_100v = best_match_22h[:, :, 3]
-        best_match_22h_tp = best_match_22h[:, :, 4]
-        best_match_22h_sp = best_match_22h[:, :, 5]
-
-        best_match_23h_2t = best_match_23h[:, :, 0]
-        best_match_23h_2d = best_match_23h[:, :, 1]
-        best_match_23h_100u = best_match_23h[:, :, 2]
-        best_match_23h_100v = best_match_23h[:, :, 3]
-        best_match_23h_tp = best_match_23h[:, :, 4]
-        best_match_23h_sp = best_match_23h[:, :, 5]
-        
-        best_match_24h_2t = best_match_24h[:, :, 0]
-        best_match_24h_2d = best_match_24h[:, :, 1]
-        best_match_24h_100u = best_match_24h[:, :, 2]
-        best_match_24h_100v = best_match_24h[:, :, 3]
-        best_match_24h_tp = best_match_24h[:, :, 4]
-        best_match_24h_sp = best_match_24h[:, :, 5]
-        
-
-        ecmwf_ifs_1h_2t = ecmwf_ifs_1h[:, :, 0]
-        ecmwf_ifs_1h_2d = ecmwf_ifs_1h[:, :, 1]
-        ecmwf_ifs_1h_100u = ecmwf_ifs_1h[:, :, 2]
-        ecmwf_ifs_1h_100v = ecmwf_ifs_1h[:, :, 3]
-        ecmwf_ifs_1h_tp = ecmwf_ifs_1h[:, :, 4]
-        ecmwf_ifs_1h_sp = ecmwf_ifs_1h[:, :, 5]
-        
-        ecmwf_ifs_2h_2t = ecmwf_ifs_2h[:, :, 0]
-        ecmwf_ifs_2h_2d = ecmwf_ifs_2h[:, :, 1]
-        ecmwf_ifs_2h_100u = ecmwf_ifs_2h[:, :, 2]
-        ecmwf_ifs_2h_100v = ecmwf_ifs_2h[:, :, 3]
-        ecmwf_ifs_2h_tp = ecmwf_ifs_2h[:, :, 4]
-        ecmwf_ifs_2h_sp = ecmwf_ifs_2h[:, :, 5]
-        
-        ecmwf_ifs_3h_2t = ecmwf_ifs_3h[:, :, 0]
-        ecmwf_ifs_3h_2d = ecmwf_ifs_3h[:, :, 1]
-        ecmwf_ifs_3h_100u = ecmwf_ifs_3h[:, :, 2]
-        ecmwf_ifs_3h_100v = ecmwf_ifs_3h[:, :, 3]
-        ecmwf_ifs_3h_tp = ecmwf_ifs_3h[:, :, 4]
-        ecmwf_ifs_3h_sp = ecmwf_ifs_3h[:, :, 5]
-        
-        ecmwf_ifs_4h_2t = ecmwf_ifs_4h[:, :, 0]
-        ecmwf_ifs_4h_2d = ecmwf_ifs_4h[:, :, 1]
-        ecmwf_ifs_4h_100u = ecmwf_ifs_4h[:, :, 2]
-        ecmwf_ifs_4h_100v = ecmwf_ifs_4h[:, :, 3]
-        ecmwf_ifs_4h_tp = ecmwf_ifs_4h[:, :, 4]
-        ecmwf_ifs_4h_sp = ecmwf_ifs_4h[:, :, 5]
-        
-        ecmwf_ifs_5h_2t = ecmwf_ifs_5h[:, :, 0]
-        ecmwf_ifs_5h_2d = ecmwf_ifs_5h[:, :, 1]
-        ecmwf_ifs_5h_100u = ecmwf_ifs_5h[:, :, 2]
-        ecmwf_ifs_5h_100v = ecmwf_ifs_5h[:, :, 3]
-        ecmwf_ifs_5h_tp = ecmwf_ifs_5h[:, :, 4]
-        ecmwf_ifs_5h_sp = ecmwf_ifs_5h[:, :, 5]
-
-        ecmwf_ifs_6h_2t = ecmwf_ifs_6h[:, :, 0]
-        ecmwf_ifs_6h_2d = ecmwf_ifs_6h[:, :, 1]
-        ecmwf_ifs_6h_100u = ecmwf_ifs_6h[:, :, 2]
-        ecmwf_ifs_6h_100v = ecmwf_ifs_6h[:, :, 3]
-        ecmwf_ifs_6h_tp = ecmwf_ifs_6h[:, :, 4]
-        ecmwf_ifs_6h_sp = ecmwf_ifs_6h[:, :, 5]
-        
-        ecmwf_ifs_7h_2t = ecmwf_ifs_7h[:, :, 0]
-        ecmwf_ifs_7h_2d = ecmwf_ifs_7h[:, :, 1]
-        ecmwf_ifs_7h_100u = ecmwf_ifs_7h[:, :, 2]
-        ecmwf_ifs_7h_100v = ecmwf_ifs_7h[:, :, 3]
-        ecmwf_ifs_7h_tp = ecmwf_ifs_7h[:, :, 4]
-        ecmwf_ifs_7h_sp = ecmwf_ifs_7h[:, :, 5]
-        
-        ecmwf_ifs_8h_2t = ecmwf_ifs_8h[:, :, 0]
-        ecmwf_ifs_8h_2d = ecmwf_ifs_8h[:, :, 1]
-        ecmwf_ifs_8h_100u = ecmwf_ifs_8h[:, :, 2]
-        ecmwf_ifs_8h_100v = ecmwf_ifs_8h[:, :, 3]
-        ecmwf_ifs_8h_tp = ecmwf_ifs_8h[:, :, 4]
-        ecmwf_ifs_8h_sp = ecmwf_ifs_8h[:, :, 5]
-        
-        ecmwf_ifs_9h_2t = ecmwf_ifs_9h[:, :, 0]
-        ecmwf_ifs_9h_2d = ecmwf_ifs_9h[:, :, 1]
-        ecmwf_ifs_9h_100u = ecmwf_ifs_9h[:, :, 2]
-        ecmwf_ifs_9h_100v = ecmwf_ifs_9h[:, :, 3]
-        ecmwf_ifs_9h_tp = ecmwf_ifs_9h[:, :, 4]
-        ecmwf_ifs_9h_sp = ecmwf_ifs_9h[:, :, 5]
-        
-        ecmwf_ifs_10h_2t = ecmwf_ifs_10h[:, :, 0]
-        ecmwf_ifs_10h_2d = ecmwf_ifs_10h[:, :, 1]
-        ecmwf_ifs_10h_100u = ecmwf_ifs_10h[:, :, 2]
-        ecmwf_ifs_10h_100v = ecmwf_ifs_10h[:, :, 3]
-        ecmwf_ifs_10h_tp = ecmwf_ifs_10h[:, :, 4]
-        ecmwf_ifs_10h_sp = ecmwf_ifs_10h[:, :, 5]
-        
-        ecmwf_ifs_11h_2t = ecmwf_ifs_11h[:, :, 0]
-        ecmwf_ifs_11h_2d = ecmwf_ifs_11h[:, :, 1]
-        ecmwf_ifs_11h_100u = ecmwf_ifs_11h[:, :, 2]
-        ecmwf_ifs_11h_100v = ecmwf_ifs_11h[:, :, 3]
-        ecmwf_ifs_11h_tp = ecmwf_ifs_11h[:, :, 4]
-        ecmwf_ifs_11h_sp = ecmwf_ifs_11h[:, :, 5]
         
-        ecmwf_ifs_12h_2t = ecmwf_ifs_12h[:, :, 0]
-        ecmwf_ifs_12h_2d = ecmwf_ifs_12h[:, :, 1]
-        ecmwf_ifs_12h_100u = ecmwf_ifs_12h[:, :, 2]
-        ecmwf_ifs_12h_100v = ecmwf_ifs_12h[:, :, 3]
-        ecmwf_ifs_12h_tp = ecmwf_ifs_12h[:, :, 4]
-        ecmwf_ifs_12h_sp = ecmwf_ifs_12h[:, :, 5]
-        
-        ecmwf_ifs_13h_2t = ecmwf_ifs_13h[:, :, 0]
-        ecmwf_ifs_13h_2d = ecmwf_ifs_13h[:, :, 1]
-        ecmwf_ifs_13h_100u = ecmwf_ifs_13h[:, :, 2]
-        ecmwf_ifs_13h_100v = ecmwf_ifs_13h[:, :, 3]
-        ecmwf_ifs_13h_tp = ecmwf_ifs_13h[:, :, 4]
-        ecmwf_ifs_13h_sp = ecmwf_ifs_13h[:, :, 5]
-        
-        ecmwf_ifs_14h_2t = ecmwf_ifs_14h[:, :, 0]
-        ecmwf_ifs_14h_2d = ecmwf_ifs_14h[:, :, 1]
-        ecmwf_ifs_14h_100u = ecmwf_ifs_14h[:, :, 2]
-        ecmwf_ifs_14h_100v = ecmwf_ifs_14h[:, :, 3]
-        ecmwf_ifs_14h_tp = ecmwf_ifs_14h[:, :, 4]
-        ecmwf_ifs_14h_sp = ecmwf_ifs_14h[:, :, 5]
-        
-        ecmwf_ifs_15h_2t = ecmwf_ifs_15h[:, :, 0]
-        ecmwf_ifs_15h_2d = ecmwf_ifs_15h[:, :, 1]
-        ecmwf_ifs_15h_100u = ecmwf_ifs_15h[:, :, 2]
-        ecmwf_ifs_15h_100v = ecmwf_ifs_15h[:, :, 3]
-        ecmwf_ifs_15h_tp = ecmwf_ifs_15h[:, :, 4]
-        ecmwf_ifs_15h_sp = ecmwf_ifs_15h[:, :, 5]
-        
-        ecmwf_ifs_16h_2t = ecmwf_ifs_16h[:, :, 0]
-        ecmwf_ifs_16h_2d = ecmwf_ifs_16h[:, :, 1]
-        ecmwf_ifs_16h_100u = ecmwf_ifs_16h[:, :, 2]
-        ecmwf_ifs_16h_100v = ecmwf_ifs_16h[:, :, 3]
-        ecmwf_ifs_16h_tp = ecmwf_ifs_16h[:, :, 4]
-        ecmwf_ifs_16h_sp = ecmwf_ifs_16h[:, :, 5]
-
-        ecmwf_ifs_17h_2t = ecmwf_ifs_17h[:, :, 0]
-        ecmwf_ifs_17h_2d = ecmwf_ifs_17h[:, :, 1]
-        ecmwf_ifs_17h_100u = ecmwf_ifs_17h[:, :, 2]
-        ecmwf_ifs_17h_100v = ecmwf_ifs_17h[:, :, 3]
-        ecmwf_ifs_17h_tp = ecmwf_ifs_17h[:, :, 4]
-        ecmwf_ifs_17h_sp = ecmwf_ifs_17h[:, :, 5]
-        
-        ecmwf_ifs_18h_2t = ecmwf_ifs_18h[:, :, 0]
-        ecmwf_ifs_18h_2d = ecmwf_ifs_18h[:, :, 1]
-        ecmwf_ifs_18h_100u = ecmwf_ifs_18h[:, :, 2]
-        ecmwf_ifs_18h_100v = ecmwf_ifs_18h[:, :, 3]
-        ecmwf_ifs_18h_tp = ecmwf_ifs_18h[:, :, 4]
-        ecmwf_ifs_18h_sp = ecmwf_ifs_18h[:, :, 5]
-        
-        ecmwf_ifs_19h_2t = ecmwf_ifs_19h[:, :, 0]
-        ecmwf_ifs_19h_2d = ecmwf_ifs_19h[:, :, 1]
-        ecmwf_ifs_19h_100u = ecmwf_ifs_19h[:, :, 2]
-        ecmwf_ifs_19h_100v = ecmwf_ifs_19h[:, :, 3]
-        ecmwf_ifs_19h_tp = ecmwf_ifs_19h[:, :, 4]
-        ecmwf_ifs_19h_sp = ecmwf_ifs_19h[:, :, 5]
-        
-        ecmwf_ifs_20h_2t = ecmwf_ifs_20h[:, :, 0]
-        ecmwf_ifs_20h_2d = ecmwf_ifs_20h[:, :, 1]
-        ecmwf_ifs_20h_100u = ecmwf_ifs_20h[:, :, 2]
-        ecmwf_ifs_20h_100v = ecmwf_ifs_20h[:, :, 3]
-        ecmwf_ifs_20h_tp = ecmwf_ifs_20h[:, :, 4]
-        ecmwf_ifs_20h_sp = ecmwf_ifs_20h[:, :, 5]
-
-        ecmwf_ifs_21h_2t = ecmwf_ifs_21h[:, :, 0]
-        ecmwf_ifs_21h_2d = ecmwf_ifs_21h[:, :, 1]
-        ecmwf_ifs_21h_100u = ecmwf_ifs_21h[:, :, 2]
-        ecmwf_ifs_21h_100v = ecmwf_ifs_21h[:, :, 3]
-        ecmwf_ifs_21h_tp = ecmwf_ifs_21h[:, :, 4]
-        ecmwf_ifs_21h_sp = ecmwf_ifs_21h[:, :, 5]
-        
-        ecmwf_ifs_22h_2t = ecmwf_ifs_22h[:, :, 0]
-        ecmwf_ifs_22h_2d = ecmwf_ifs_22h[:, :, 1]
-        ecmwf_ifs_22h_100u = ecmwf_ifs_22h[:, :, 2]
-        ecmwf_ifs_22h_100v = ecmwf_ifs_22h[:, :, 3]
-        ecmwf_ifs_22h_tp = ecmwf_ifs_22h[:, :, 4]
-        ecmwf_ifs_22h_sp = ecmwf_ifs_22h[:, :, 5]
-        
-        ecmwf_ifs_23h_2t = ecmwf_ifs_23h[:, :, 0]
-        ecmwf_ifs_23h_2d = ecmwf_ifs_23h[:, :, 1]
-        ecmwf_ifs_23h_100u = ecmwf_ifs_23h[:, :, 2]
-        ecmwf_ifs_23h_100v = ecmwf_ifs_23h[:, :, 3]
-        ecmwf_ifs_23h_tp = ecmwf_ifs_23h[:, :, 4]
-        ecmwf_ifs_23h_sp = ecmwf_ifs_23h[:, :, 5]
-        
-        ecmwf_ifs_24h_2t = ecmwf_ifs_24h[:, :, 0]
-        ecmwf_ifs_24h_2d = ecmwf_ifs_24h[:, :, 1]
-        ecmwf_ifs_24h_100u = ecmwf_ifs_24h[:, :, 2]
-        ecmwf_ifs_24h_100v = ecmwf_ifs_24h[:, :, 3]
-        ecmwf_ifs_24h_tp = ecmwf_ifs_24h[:, :, 4]
-        ecmwf_ifs_24h_sp = ecmwf_ifs_24h[:, :, 5]
-        
-        gfs_global_1h_2t = gfs_global_1h[:, :, 0]
-        gfs_global_1h_2d = gfs_global_1h[:, :, 1]
-        gfs_global_1h_100u = gfs_global_1h[:, :, 2]
-        gfs_global_1h_100v = gfs_global_1h[:, :, 3]
-        gfs_global_1h_tp = gfs_global_1h[:, :, 4]
-        gfs_global_1h_sp = gfs_global_1h[:, :, 5]
-        
-        gfs_global_2h_2t = gfs_global_2h[:, :, 0]
-        gfs_global_2h_2d = gfs_global_2h[:, :, 1]
-        gfs_global_2h_100u = gfs_global_2h[:, :, 2]
-        gfs_global_2h_100v = gfs_global_2h[:, :, 3]
-        gfs_global_2h_tp = gfs_global_2h[:, :, 4]
-        gfs_global_2h_sp = gfs_global_2h[:, :, 5]
-        
-        gfs_global_3h_2t = gfs_global_3h[:, :, 0]
-        gfs_global_3h_2d = gfs_global_3h[:, :, 1]
-        gfs_global_3h_100u = gfs_global_3h[:, :, 2]
-        gfs_global_3h_100v = gfs_global_3h[:, :, 3]
-        gfs_global_3h_tp = gfs_global_3h[:, :, 4]
-        gfs_global_3h_sp = gfs_global_3h[:, :, 5]
-        
-        gfs_global_4h_2t = gfs_global_4h[:, :, 0]
-        gfs_global_4h_2d = gfs_global_4h[:, :, 1]
-        gfs_global_4h_100u = gfs_global_4h[:, :, 2]
-        gfs_global_4h_100v = gfs_global_4h[:, :, 3]
-        gfs_global_4h_tp = gfs_global_4h[:, :, 4]
-        gfs_global_4h_sp = gfs_global_4h[:, :, 5]
-        
-        gfs_global_5h_2t = gfs_global_5h[:, :, 0]
-        gfs_global_5h_2d = gfs_global_5h[:, :, 1]
-        gfs_global_5h_100u = gfs_global_5h[:, :, 2]
-        gfs_global_5h_100v = gfs_global_5h[:, :, 3]
-        gfs_global_5h_tp = gfs_global_5h[:, :, 4]
-        gfs_global_5h_sp = gfs_global_5h[:, :, 5]
-
-        gfs_global_6h_2t = gfs_global_6h[:, :, 0]
-        gfs_global_6h_2d = gfs_global_6h[:, :, 1]
-        gfs_global_6h_100u = gfs_global_6h[:, :, 2]
-        gfs_global_6h_100v = gfs_global_6h[:, :, 3]
-        gfs_global_6h_tp = gfs_global_6h[:, :, 4]
-        gfs_global_6h_sp = gfs_global_6h[:, :, 5]
-
-        gfs_global_7h_2t = gfs_global_7h[:, :, 0]
-        gfs_global_7h_2d = gfs_global_7h[:, :, 1]
-        gfs_global_7h_100u = gfs_global_7h[:, :, 2]
-        gfs_global_7h_100v = gfs_global_7h[:, :, 3]
-        gfs_global_7h_tp = gfs_global_7h[:, :, 4]
-        gfs_global_7h_sp = gfs_global_7h[:, :, 5]
-        
-        gfs_global_8h_2t = gfs_global_8h[:, :, 0]
-        gfs_global_8h_2d = gfs_global_8h[:, :, 1]
-        gfs_global_8h_100u = gfs_global_8h[:, :, 2]
-        gfs_global_8h_100v = gfs_global_8h[:, :, 3]
-        gfs_global_8h_tp = gfs_global_8h[:, :, 4]
-        gfs_global_8h_sp = gfs_global_8h[:, :, 5]
-        
-        gfs_global_9h_2t = gfs_global_9h[:, :, 0]
-        gfs_global_9h_2d = gfs_global_9h[:, :, 1]
-        gfs_global_9h_100u = gfs_global_9h[:, :, 2]
-        gfs_global_9h_100v = gfs_global_9h[:, :, 3]
-        gfs_global_9h_tp = gfs_global_9h[:, :, 4]
-        gfs_global_9h_sp = gfs_global_9h[:, :, 5]
-        
-        gfs_global_10h_2t = gfs_global_10h[:, :, 0]
-        gfs_global_10h_2d = gfs_global_10h[:, :, 1]
-        gfs_global_10h_100u = gfs_global_10h[:, :, 2]
-        gfs_global_10h_100v = gfs_global_10h[:, :, 3]
-        gfs_global_10h_tp = gfs_global_10h[:, :, 4]
-        gfs_global_10h_sp = gfs_global_10h[:, :, 5]
-        
-        gfs_global_11h_2t = gfs_global_11h[:, :, 0]
-        gfs_global_11h_2d = gfs_global_11h[:, :, 1]
-        gfs_global_11h_100u = gfs_global_11h[:, :, 2]
-        gfs_global_11h_100v = gfs_global_11h[:, :, 3]
-        gfs_global_11h_tp = gfs_global_11h[:, :, 4]
-        gfs_global_11h_sp = gfs_global_11h[:, :, 5]
-        
-        gfs_global_12h_2t = gfs_global_12h[:, :, 0]
-        gfs_global_12h_2d = gfs_global_12h[:, :, 1]
-        gfs_global_12h_100u = gfs_global_12h[:, :, 2]
-        gfs_global_12h_100v = gfs_global_12h[:, :, 3]
-        gfs_global_12h_tp = gfs_global_12h[:, :, 4]
-        gfs_global_12h_sp = gfs_global_12h[:, :, 5]
-        
-        gfs_global_13h_2t = gfs_global_13h[:, :, 0]
-        gfs_global_13h_2d = gfs_global_13h[:, :, 1]
-        gfs_global_13h_100u = gfs_global_13h[:, :, 2]
-        gfs_global_13h_100v = gfs_global_13h[:, :, 3]
-        gfs_global_13h_tp = gfs_global_13h[:, :, 4]
-        gfs_global_13h_sp = gfs_global_13h[:, :, 5]
-        
-        gfs_global_14h_2t = gfs_global_14h[:, :, 0]
-        gfs_global_14h_2d = gfs_global_14h[:, :, 1]
-        gfs_global_14h_100u = gfs_global_14h[:, :, 2]
-        gfs_global_14h_100v = gfs_global_14h[:, :, 3]
-        gfs_global_14h_tp = gfs_global_14h[:, :, 4]
-        gfs_global_14h_sp = gfs_global_14h[:, :, 5]
-        
-        gfs_global_15h_2t = gfs_global_15h[:, :, 0]
-        gfs_global_15h_2d = gfs_global_15h[:, :, 1]
-        gfs_global_15h_100u = gfs_global_15h[:, :, 2]
-        gfs_global_15h_100v = gfs_global_15h[:, :, 3]
-        gfs_global_15h_tp = gfs_global_15h[:, :, 4]
-        gfs_global_15h_sp = gfs_global_15h[:, :, 5]
-        
-        gfs_global_16h_2t = gfs_global_16h[:, :, 0]
-        gfs_global_16h_2d = gfs_global_16h[:, :, 1]
-        gfs_global_16h_100u = gfs_global_16h[:, :, 2]
-        gfs_global_16h_100v = gfs_global_16h[:, :, 3]
-        gfs_global_16h_tp = gfs_global_16h[:, :, 4]
-        gfs_global_16h_sp = gfs_global_16h[:, :, 5]
-        
-        gfs_global_17h_2t = gfs_global_17h[:, :, 0]
-        gfs_global_17h_2d = gfs_global_17h[:, :, 1]
-        gfs_global_17h_100u = gfs_global_17h[:, :, 2]
-        gfs_global_17h_100v = gfs_global_17h[:, :, 3]
-        gfs_global_17h_tp = gfs_global_17h[:, :, 4]
-        gfs_global_17h_sp = gfs_global_17h[:, :, 5]
-        
-        gfs_global_18h_2t = gfs_global_18h[:, :, 0]
-        gfs_global_18h_2d = gfs_global_18h[:, :, 1]
-        gfs_global_18h_100u = gfs_global_18h[:, :, 2]
-        gfs_global_18h_100v = gfs_global_18h[:, :, 3]
-        gfs_global_18h_tp = gfs_global_18h[:, :, 4]
-        gfs_global_18h_sp = gfs_global_18h[:, :, 5]
-        
-        gfs_global_19h_2t = gfs_global_19h[:, :, 0]
-        gfs_global_19h_2d = gfs_global_19h[:, :, 1]
-        gfs_global_19h_100u = gfs_global_19h[:, :, 2]
-        gfs_global_19h_100v = gfs_global_19h[:, :, 3]
-        gfs_global_19h_tp = gfs_global_19h[:, :, 4]
-        gfs_global_19h_sp = gfs_global_19h[:, :, 5]
-        
-        gfs_global_20h_2t = gfs_global_20h[:, :, 0]
-        gfs_global_20h_2d = gfs_global_20h[:, :, 1]
-        gfs_global_20h_100u = gfs_global_20h[:, :, 2]
-        gfs_global_20h_100v = gfs_global_20h[:, :, 3]
-        gfs_global_20h_tp = gfs_global_20h[:, :, 4]
-        gfs_global_20h_sp = gfs_global_20h[:, :, 5]
-        
-        gfs_global_21h_2t = gfs_global_21h[:, :, 0]
-        gfs_global_21h_2d = gfs_global_21h[:, :, 1]
-        gfs_global_21h_100u = gfs_global_21h[:, :, 2]
-        gfs_global_21h_100v = gfs_global_21h[:, :, 3]
-        gfs_global_21h_tp = gfs_global_21h[:, :, 4]
-        gfs_global_21h_sp = gfs_global_21h[:, :, 5]
-        
-        gfs_global_22h_2t = gfs_global_22h[:, :, 0]
-        gfs_global_22h_2d = gfs_global_22h[:, :, 1]
-        gfs_global_22h_100u = gfs_global_22h[:, :, 2]
-        gfs_global_22h_100v = gfs_global_22h[:, :, 3]
-        gfs_global_22h_tp = gfs_global_22h[:, :, 4]
-        gfs_global_22h_sp = gfs_global_22h[:, :, 5]
-        
-        gfs_global_23h_2t = gfs_global_23h[:, :, 0]
-        gfs_global_23h_2d = gfs_global_23h[:, :, 1]
-        gfs_global_23h_100u = gfs_global_23h[:, :, 2]
-        gfs_global_23h_100v = gfs_global_23h[:, :, 3]
-        gfs_global_23h_tp = gfs_global_23h[:, :, 4]
-        gfs_global_23h_sp = gfs_global_23h[:, :, 5]
-        
-        gfs_global_24h_2t = gfs_global_24h[:, :, 0]
-        gfs_global_24h_2d = gfs_global_24h[:, :, 1]
-        gfs_global_24h_100u = gfs_global_24h[:, :, 2]
-        gfs_global_24h_100v = gfs_global_24h[:, :, 3]
-        gfs_global_24h_tp = gfs_global_24h[:, :, 4]
-        gfs_global_24h_sp = gfs_global_24h[:, :, 5]
-        
-        AIFS_1h_2t = AIFS_1h[:, :, 0]
-        AIFS_1h_2d = AIFS_1h[:, :, 1]
-        AIFS_1h_100u = AIFS_1h[:, :, 2]
-        AIFS_1h_100v = AIFS_1h[:, :, 3]
-        AIFS_1h_tp = AIFS_1h[:, :, 4]
-        AIFS_1h_sp = AIFS_1h[:, :, 5]
-        
-        AIFS_2h_2t = AIFS_2h[:, :, 0]
-        AIFS_2h_2d = AIFS_2h[:, :, 1]
-        AIFS_2h_100u = AIFS_2h[:, :, 2]
-        AIFS_2h_100v = AIFS_2h[:, :, 3]
-        AIFS_2h_tp = AIFS_2h[:, :, 4]
-        AIFS_2h_sp = AIFS_2h[:, :, 5]
-        
-        AIFS_3h_2t = AIFS_3h[:, :, 0]
-        AIFS_3h_2d = AIFS_3h[:, :, 1]
-        AIFS_3h_100u = AIFS_3h[:, :, 2]
-        AIFS_3h_100v = AIFS_3h[:, :, 3]
-        AIFS_3h_tp = AIFS_3h[:, :, 4]
-        AIFS_3h_sp = AIFS_3h[:, :, 5]
-        
-        AIFS_4h_2t = AIFS_4h[:, :, 0]
-        AIFS_4h_2d = AIFS_4h[:, :, 1]
-        AIFS_4h_100u = AIFS_4h[:, :, 2]
-        AIFS_4h_100v = AIFS_4h[:, :, 3]
-        AIFS_4h_tp = AIFS_4h[:, :, 4]
-        AIFS_4h_sp = AIFS_4h[:, :, 5]
-        
-        AIFS_5h_2t = AIFS_5h[:, :, 0]
-        AIFS_5h_2d = AIFS_5h[:, :, 1]
-        AIFS_5h_100u = AIFS_5h[:, :, 2]
-        AIFS_5h_100v = AIFS_5h[:, :, 3]
-        AIFS_5h_tp = AIFS_5h[:, :, 4]
-        AIFS_5h_sp = AIFS_5h[:, :, 5]
-        
-        AIFS_6h_2t = AIFS_6h[:, :, 0]
-        AIFS_6h_2d = AIFS_6h[:, :, 1]
-        AIFS_6h_100u = AIFS_6h[:, :, 2]
-        AIFS_6h_100v = AIFS_6h[:, :, 3]
-        AIFS_6h_tp = AIFS_6h[:, :, 4]
-        AIFS_6h_sp = AIFS_6h[:, :, 5]
-        
-        AIFS_7h_2t = AIFS_7h[:, :, 0]
-        AIFS_7h_2d = AIFS_7h[:, :, 1]
-        AIFS_7h_100u = AIFS_7h[:, :, 2]
-        AIFS_7h_100v = AIFS_7h[:, :, 3]
-        AIFS_7h_tp = AIFS_7h[:, :, 4]
-        AIFS_7h_sp = AIFS_7h[:, :, 5]
-        
-        AIFS_8h_2t = AIFS_8h[:, :, 0]
-        AIFS_8h_2d = AIFS_8h[:, :, 1]
-        AIFS_8h_100u = AIFS_8h[:, :, 2]
-        AIFS_8h_100v = AIFS_8h[:, :, 3]
-        AIFS_8h_tp = AIFS_8h[:, :, 4]
-        AIFS_8h_sp = AIFS_8h[:, :, 5]
-        
-        AIFS_9h_2t = AIFS_9h[:, :, 0]
-        AIFS_9h_2d = AIFS_9h[:, :, 1]
-        AIFS_9h_100u = AIFS_9h[:, :, 2]
-        AIFS_9h_100v = AIFS_9h[:, :, 3]
-        AIFS_9h_tp = AIFS_9h[:, :, 4]
-        AIFS_9h_sp = AIFS_9h[:, :, 5]
-        
-        AIFS_10h_2t = AIFS_10h[:, :, 0]
-        AIFS_10h_2d = AIFS_10h[:, :, 1]
-        AIFS_10h_100u = AIFS_10h[:, :, 2]
-        AIFS_10h_100v = AIFS_10h[:, :, 3]
-        AIFS_10h_tp = AIFS_10h[:, :, 4]
-        AIFS_10h_sp = AIFS_10h[:, :, 5]
-
-        AIFS_11h_2t = AIFS_11h[:, :, 0]
-        AIFS_11h_2d = AIFS_11h[:, :, 1]
-        AIFS_11h_100u = AIFS_11h[:, :, 2]
-        AIFS_11h_100v = AIFS_11h[:, :, 3]
-        AIFS_11h_tp = AIFS_11h[:, :, 4]
-        AIFS_11h_sp = AIFS_11h[:, :, 5]
-        
-        AIFS_12h_2t = AIFS_12h[:, :, 0]
-        AIFS_12h_2d = AIFS_12h[:, :, 1]
-        AIFS_12h_100u = AIFS_12h[:, :, 2]
-        AIFS_12h_100v = AIFS_12h[:, :, 3]
-        AIFS_12h_tp = AIFS_12h[:, :, 4]
-        AIFS_12h_sp = AIFS_12h[:, :, 5]
-        
-        AIFS_13h_2t = AIFS_13h[:, :, 0]
-        AIFS_13h_2d = AIFS_13h[:, :, 1]
-        AIFS_13h_100u = AIFS_13h[:, :, 2]
-        AIFS_13h_100v = AIFS_13h[:, :, 3]
-        AIFS_13h_tp = AIFS_13h[:, :, 4]
-        AIFS_13h_sp = AIFS_13h[:, :, 5]
-        
-        AIFS_14h_2t = AIFS_14h[:, :, 0]
-        AIFS_14h_2d = AIFS_14h[:, :, 1]
-        AIFS_14h_100u = AIFS_14h[:, :, 2]
-        AIFS_14h_100v = AIFS_14h[:, :, 3]
-        AIFS_14h_tp = AIFS_14h[:, :, 4]
-        AIFS_14h_sp = AIFS_14h[:, :, 5]
-
-        AIFS_15h_2t = AIFS_15h[:, :, 0]
-        AIFS_15h_2d = AIFS_15h[:, :, 1]
-        AIFS_15h_100u = AIFS_15h[:, :, 2]
-        AIFS_15h_100v = AIFS_15h[:, :, 3]
-        AIFS_15h_tp = AIFS_15h[:, :, 4]
-        AIFS_15h_sp = AIFS_15h[:, :, 5]
-        
-
-        AIFS_16h_2t = AIFS_16h[:, :, 0]
-        AIFS_16h_2d = AIFS_16h[:, :, 1]
-        AIFS_16h_100u = AIFS_16h[:, :, 2]
-        AIFS_16h_100v = AIFS_16h[:, :, 3]
-        AIFS_16h_tp = AIFS_16h[:, :, 4]
-        AIFS_16h_sp = AIFS_16h[:, :, 5]
-        
-        AIFS_17h_2t = AIFS_17h[:, :, 0]
-        AIFS_17h_2d = AIFS_17h[:, :, 1]
-        AIFS_17h_100u = AIFS_17h[:, :, 2]
-        AIFS_17h_100v = AIFS_17h[:, :, 3]
-        AIFS_17h_tp = AIFS_17h[:, :, 4]
-        AIFS_17h_sp = AIFS_17h[:, :, 5]
-        
-        AIFS_18h_2t = AIFS_18h[:, :, 0]
-        AIFS_18h_2d = AIFS_18h[:, :, 1]
-        AIFS_18h_100u = AIFS_18h[:, :, 2]
-        AIFS_18h_100v = AIFS_18h[:, :, 3]
-        AIFS_18h_tp = AIFS_18h[:, :, 4]
-        AIFS_18h_sp = AIFS_18h[:, :, 5]
-        
-        AIFS_19h_2t = AIFS_19h[:, :, 0]
-        AIFS_19h_2d = AIFS_19h[:, :, 1]
-        AIFS_19h_100u = AIFS_19h[:, :, 2]
-        AIFS_19h_100v = AIFS_19h[:, :, 3]
-        AIFS_19h_tp = AIFS_19h[:, :, 4]
-        AIFS_19h_sp = AIFS_19h[:, :, 5]
-        
-        AIFS_20h_2t = AIFS_20h[:, :, 0]
-        AIFS_20h_2d = AIFS_20h[:, :, 1]
-        AIFS_20h_100u = AIFS_20h[:, :, 2]
-        AIFS_20h_100v = AIFS_20h[:, :, 3]
-        AIFS_20h_tp = AIFS_20h[:, :, 4]
-        AIFS_20h_sp = AIFS_20h[:, :, 5]
-
-        AIFS_21h_2t = AIFS_21h[:, :, 0]
-        AIFS_21h_2d = AIFS_21h[:, :, 1]
-        AIFS_21h_100u = AIFS_21h[:, :, 2]
-        AIFS_21h_100v = AIFS_21h[:, :, 3]
-        AIFS_21h_tp = AIFS_21h[:, :, 4]
-        AIFS_21h_sp = AIFS_21h[:, :, 5]
-        
-        AIFS_22h_2t = AIFS_22h[:, :, 0]
-        AIFS_22h_2d = AIFS_22h[:, :, 1]
-        AIFS_22h_100u = AIFS_22h[:, :, 2]
-        AIFS_22h_100v = AIFS_22h[:, :, 3]
-        AIFS_22h_tp = AIFS_22h[:, :, 4]
-        AIFS_22h_sp = AIFS_22h[:, :, 5]
-        
-        AIFS_23h_2t = AIFS_23h[:, :, 0]
-        AIFS_23h_2d = AIFS_23h[:, :, 1]
-        AIFS_23h_100u = AIFS_23h[:, :, 2]
-        AIFS_23h_100v = AIFS_23h[:, :, 3]
-        AIFS_23h_tp = AIFS_23h[:, :, 4]
-        AIFS_23h_sp = AIFS_23h[:, :, 5]
-        
-        AIFS_24h_2t = AIFS_24h[:, :, 0]
-        AIFS_24h_2d = AIFS_24h[:, :, 1]
-        AIFS_24h_100u = AIFS_24h[:, :, 2]
-        AIFS_24h_100v = AIFS_24h[:, :, 3]
-        AIFS_24h_tp = AIFS_24h[:, :, 4]
-        AIFS_24h_sp = AIFS_24h[:, :, 5]
-        
-        CMA_1h_2t = CMA_1h[:,:,0]
-        CMA_1h_2d = CMA_1h[:,:,1]
-        CMA_1h_100u = CMA_1h[:,:,2]
-        CMA_1h_100v = CMA_1h[:,:,3]
-        CMA_1h_tp = CMA_1h[:,:,4]
-        CMA_1h_sp = CMA_1h[:,:,5]
-        
-        CMA_2h_2t = CMA_2h[:,:,0]
-        CMA_2h_2d = CMA_2h[:,:,1]
-        CMA_2h_100u = CMA_2h[:,:,2]
-        CMA_2h_100v = CMA_2h[:,:,3]  
-        CMA_2h_tp = CMA_2h[:,:,4]
-        CMA_2h_sp = CMA_2h[:,:,5]
-        
-        CMA_3h_2t = CMA_3h[:,:,0]
-        CMA_3h_2d = CMA_3h[:,:,1]
-        CMA_3h_100u = CMA_3h[:,:,2]
-        CMA_3h_100v = CMA_3h[:,:,3]
-        CMA_3h_tp = CMA_3h[:,:,4]
-        CMA_3h_sp = CMA_3h[:,:,5]
-
-        CMA_4h_2t = CMA_4h[:,:,0]
-        CMA_4h_2d = CMA_4h[:,:,1]
-        CMA_4h_100u = CMA_4h[:,:,2]
-        CMA_4h_100v = CMA_4h[:,:,3]
-        CMA_4h_tp = CMA_4h[:,:,4]
-        CMA_4h_sp = CMA_4h[:,:,5]
-        
-        CMA_5h_2t = CMA_5h[:,:,0]
-        CMA_5h_2d = CMA_5h[:,:,1]
-        CMA_5h_100u = CMA_5h[:,:,2]
-        CMA_5h_100v = CMA_5h[:,:,3]
-        CMA_5h_tp = CMA_5h[:,:,4]
-        CMA_5h_sp = CMA_5h[:,:,5]
-        
-        CMA_6h_2t = CMA_6h[:,:,0]
-        CMA_6h_2d = CMA_6h[:,:,1]
-        CMA_6h_100u = CMA_6h[:,:,2]
-        CMA_6h_100v = CMA_6h[:,:,3]
-        CMA_6h_tp = CMA_6h[:,:,4]
-        CMA_6h_sp = CMA_6h[:,:,5]
-        
-        CMA_7h_2t = CMA_7h[:,:,0]
-        CMA_7h_2d = CMA_7h[:,:,1]
-        CMA_7h_100u = CMA_7h[:,:,2]
-        CMA_7h_100v = CMA_7h[:,:,3]
-        CMA_7h_tp = CMA_7h[:,:,4]
-        CMA_7h_sp = CMA_7h[:,:,5]
-        
-        CMA_8h_2t = CMA_8h[:,:,0]
-        CMA_8h_2d = CMA_8h[:,:,1]
-        CMA_8h_100u = CMA_8h[:,:,2]
-        CMA_8h_100v = CMA_8h[:,:,3]
-        CMA_8h_tp = CMA_8h[:,:,4]
-        CMA_8h_sp = CMA_8h[:,:,5]
-        
-        CMA_9h_2t = CMA_9h[:,:,0]
-        CMA_9h_2d = CMA_9h[:,:,1]
-        CMA_9h_100u = CMA_9h[:,:,2]
-        CMA_9h_100v = CMA_9h[:,:,3]
-        CMA_9h_tp = CMA_9h[:,:,4]
-        CMA_9h_sp = CMA_9h[:,:,5]
-        
-        CMA_10h_2t = CMA_10h[:,:,0]
-        CMA_10h_2d = CMA_10h[:,:,1]
-        CMA_10h_100u = CMA_10h[:,:,2]
-        CMA_10h_100v = CMA_10h[:,:,3]
-        CMA_10h_tp = CMA_10h[:,:,4]
-        CMA_10h_sp = CMA_10h[:,:,5]
-        
-        CMA_11h_2t = CMA_11h[:,:,0]
-        CMA_11h_2d = CMA_11h[:,:,1]
-        CMA_11h_100u = CMA_11h[:,:,2]
-        CMA_11h_100v = CMA_11h[:,:,3]
-        CMA_11h_tp = CMA_11h[:,:,4]
-        CMA_11h_sp = CMA_11h[:,:,5]
-        
-        CMA_12h_2t = CMA_12h[:,:,0]
-        CMA_12h_2d = CMA_12h[:,:,1]
-        CMA_12h_100u = CMA_12h[:,:,2]
-        CMA_12h_100v = CMA_12h[:,:,3]
-        CMA_12h_tp = CMA_12h[:,:,4]
-        CMA_12h_sp = CMA_12h[:,:,5]
-        
-        CMA_13h_2t = CMA_13h[:,:,0]
-        CMA_13h_2d = CMA_13h[:,:,1]
-        CMA_13h_100u = CMA_13h[:,:,2]
-        CMA_13h_100v = CMA_13h[:,:,3]
-        CMA_13h_tp = CMA_13h[:,:,4]
-        CMA_13h_sp = CMA_13h[:,:,5]
-        
-        CMA_14h_2t = CMA_14h[:,:,0]
-        CMA_14h_2d = CMA_14h[:,:,1]
-        CMA_14h_100u = CMA_14h[:,:,2]
-        CMA_14h_100v = CMA_14h[:,:,3]
-        CMA_14h_tp = CMA_14h[:,:,4]
-        CMA_14h_sp = CMA_14h[:,:,5]
-        
-        CMA_15h_2t = CMA_15h[:,:,0]
-        CMA_15h_2d = CMA_15h[:,:,1]
-        CMA_15h_100u = CMA_15h[:,:,2]
-        CMA_15h_100v = CMA_15h[:,:,3]
-        CMA_15h_tp = CMA_15h[:,:,4]
-        CMA_15h_sp = CMA_15h[:,:,5]
-        
-        CMA_16h_2t = CMA_16h[:,:,0]
-        CMA_16h_2d = CMA_16h[:,:,1]
-        CMA_16h_100u = CMA_16h[:,:,2]
-        CMA_16h_100v = CMA_16h[:,:,3]
-        CMA_16h_tp = CMA_16h[:,:,4]
-        CMA_16h_sp = CMA_16h[:,:,5]
-        
-        CMA_17h_2t = CMA_17h[:,:,0]
-        CMA_17h_2d = CMA_17h[:,:,1]
-        CMA_17h_100u = CMA_17h[:,:,2]
-        CMA_17h_100v = CMA_17h[:,:,3]
-        CMA_17h_tp = CMA_17h[:,:,4]
-        CMA_17h_sp = CMA_17h[:,:,5]
-        
-        CMA_18h_2t = CMA_18h[:,:,0]
-        CMA_18h_2d = CMA_18h[:,:,1]
-        CMA_18h_100u = CMA_18h[:,:,2]
-        CMA_18h_100v = CMA_18h[:,:,3]
-        CMA_18h_tp = CMA_18h[:,:,4]
-        CMA_18h_sp = CMA_18h[:,:,5]
-        
-        CMA_19h_2t = CMA_19h[:,:,0]
-        CMA_19h_2d = CMA_19h[:,:,1]
-        CMA_19h_100u = CMA_19h[:,:,2]
-        CMA_19h_100v = CMA_19h[:,:,3]
-        CMA_19h_tp = CMA_19h[:,:,4]
-        CMA_19h_sp = CMA_19h[:,:,5]
-        
-        CMA_20h_2t = CMA_20h[:,:,0]
-        CMA_20h_2d = CMA_20h[:,:,1]
-        CMA_20h_100u = CMA_20h[:,:,2]
-        CMA_20h_100v = CMA_20h[:,:,3]
-        CMA_20h_tp = CMA_20h[:,:,4]
-        CMA_20h_sp = CMA_20h[:,:,5]
-
-        CMA_21h_2t = CMA_21h[:,:,0]
-        CMA_21h_2d = CMA_21h[:,:,1]
-        CMA_21h_100u = CMA_21h[:,:,2]
-        CMA_21h_100v = CMA_21h[:,:,3]
-        CMA_21h_tp = CMA_21h[:,:,4]
-        CMA_21h_sp = CMA_21h[:,:,5]
-        
-        CMA_22h_2t = CMA_22h[:,:,0]
-        CMA_22h_2d = CMA_22h[:,:,1]
-        CMA_22h_100u = CMA_22h[:,:,2]
-        CMA_22h_100v = CMA_22h[:,:,3]
-        CMA_22h_tp = CMA_22h[:,:,4]
-        CMA_22h_sp = CMA_22h[:,:,5]
-        
-        CMA_23h_2t = CMA_23h[:,:,0]
-        CMA_23h_2d = CMA_23h[:,:,1]
-        CMA_23h_100u = CMA_23h[:,:,2]
-        CMA_23h_100v = CMA_23h[:,:,3]
-        CMA_23h_tp = CMA_23h[:,:,4]
-        CMA_23h_sp = CMA_23h[:,:,5]
-        
-        CMA_24h_2t = CMA_24h[:,:,0]
-        CMA_24h_2d = CMA_24h[:,:,1]
-        CMA_24h_100u = CMA_24h[:,:,2]
-        CMA_24h_100v = CMA_24h[:,:,3]
-        CMA_24h_tp = CMA_24h[:,:,4]
-        CMA_24h_sp = CMA_24h[:,:,5]
-        
-        era5_1h_2t = era5_1h[:, :, 0]
-        era5_1h_2d = era5_1h[:, :, 1]
-        era5_1h_100u = era5_1h[:, :, 2]
-        era5_1h_100v = era5_1h[:, :, 3]
-        era5_1h_tp = era5_1h[:, :, 4]
-        era5_1h_sp = era5_1h[:, :, 5]
-        
-        era5_2h_2t = era5_2h[:, :, 0]
-        era5_2h_2d = era5_2h[:, :, 1]
-        era5_2h_100u = era5_2h[:, :, 2]
-        era5_2h_100v = era5_2h[:, :, 3]
-        era5_2h_tp = era5_2h[:, :, 4]
-        era5_2h_sp = era5_2h[:, :, 5]
-
-        era5_3h_2t = era5_3h[:, :, 0]
-        era5_3h_2d = era5_3h[:, :, 1]
-        era5_3h_100u = era5_3h[:, :, 2]
-        era5_3h_100v = era5_3h[:, :, 3]
-        era5_3h_tp = era5_3h[:, :, 4]
-        era5_3h_sp = era5_3h[:, :, 5]
-        
-
-        era5_4h_2t = era5_4h[:, :, 0]
-        era5_4h_2d = era5_4h[:, :, 1]
-        era5_4h_100u = era5_4h[:, :, 2]
-        era5_4h_100v = era5_4h[:, :, 3]
-        era5_4h_tp = era5_4h[:, :, 4]
-        era5_4h_sp = era5_4h[:, :, 5]
-        
-
-        era5_5h_2t = era5_5h[:, :, 0]
-        era5_5h_2d = era5_5h[:, :, 1]
-        era5_5h_100u = era5_5h[:, :, 2]
-        era5_5h_100v = era5_5h[:, :, 3]
-        era5_5h_tp = era5_5h[:, :, 4]
-        era5_5h_sp = era5_5h[:, :, 5]
-        
-
-        era5_6h_2t = era5_6h[:, :, 0]
-        era5_6h_2d = era5_6h[:, :, 1]
-        era5_6h_100u = era5_6h[:, :, 2]
-        era5_6h_100v = era5_6h[:, :, 3]
-        era5_6h_tp = era5_6h[:, :, 4]
-        era5_6h_sp = era5_6h[:, :, 5]
-
-        era5_7h_2t = era5_7h[:, :, 0]
-        era5_7h_2d = era5_7h[:, :, 1]
-        era5_7h_100u = era5_7h[:, :, 2]
-        era5_7h_100v = era5_7h[:, :, 3]
-        era5_7h_tp = era5_7h[:, :, 4]
-        era5_7h_sp = era5_7h[:, :, 5]
-        
-        
-        era5_8h_2t = era5_8h[:, :, 0]
-        era5_8h_2d = era5_8h[:, :, 1]
-        era5_8h_100u = era5_8h[:, :, 2]
-        era5_8h_100v = era5_8h[:, :, 3]
-        era5_8h_tp = era5_8h[:, :, 4]
-        era5_8h_sp = era5_8h[:, :, 5]
-        
-        
-        era5_9h_2t = era5_9h[:, :, 0]
-        era5_9h_2d = era5_9h[:, :, 1]
-        era5_9h_100u = era5_9h[:, :, 2]
-        era5_9h_100v = era5_9h[:, :, 3]
-        era5_9h_tp = era5_9h[:, :, 4]
-        era5_9h_sp = era5_9h[:, :, 5]
-
-        era5_10h_2t = era5_10h[:, :, 0]
-        era5_10h_2d = era5_10h[:, :, 1]
-        era5_10h_100u = era5_10h[:, :, 2]
-        era5_10h_100v = era5_10h[:, :, 3]
-        era5_10h_tp = era5_10h[:, :, 4]
-        era5_10h_sp = era5_10h[:, :, 5]
-        
-        era5_11h_2t = era5_11h[:, :, 0]
-        era5_11h_2d = era5_11h[:, :, 1]
-        era5_11h_100u = era5_11h[:, :, 2]
-        era5_11h_100v = era5_11h[:, :, 3]
-        era5_11h_tp = era5_11h[:, :, 4]
-        era5_11h_sp = era5_11h[:, :, 5]
-        
-        
-        era5_12h_2t = era5_12h[:, :, 0]
-        era5_12h_2d = era5_12h[:, :, 1]
-        era5_12h_100u = era5_12h[:, :, 2]
-        era5_12h_100v = era5_12h[:, :, 3]
-        era5_12h_tp = era5_12h[:, :, 4]
-        era5_12h_sp = era5_12h[:, :, 5]
-        
-        
-        era5_13h_2t = era5_13h[:, :, 0]
-        era5_13h_2d = era5_13h[:, :, 1]
-        era5_13h_100u = era5_13h[:, :, 2]
-        era5_13h_100v = era5_13h[:, :, 3]
-        era5_13h_tp = era5_13h[:, :, 4]
-        era5_13h_sp = era5_13h[:, :, 5]
-        
-        
-        era5_14h_2t = era5_14h[:, :, 0]
-        era5_14h_2d = era5_14h[:, :, 1]
-        era5_14h_100u = era5_14h[:, :, 2]
-        era5_14h_100v = era5_14h[:, :, 3]
-        era5_14h_tp = era5_14h[:, :, 4]
-        era5_14h_sp = era5_14h[:, :, 5]
-        
-        
-        
-        era5_15h_2t = era5_15h[:, :, 0]
-        era5_15h_2d = era5_15h[:, :, 1]
-        era5_15h_100u = era5_15h[:, :, 2]
-        era5_15h_100v = era5_15h[:, :, 3]
-        era5_15h_tp = era5_15h[:, :, 4]
-        era5_15h_sp = era5_15h[:, :, 5]
-
-
-        era5_16h_2t = era5_16h[:, :, 0]
-        era5_16h_2d = era5_16h[:, :, 1]
-        era5_16h_100u = era5_16h[:, :, 2]
-        era5_16h_100v = era5_16h[:, :, 3]
-        era5_16h_tp = era5_16h[:, :, 4]
-        era5_16h_sp = era5_16h[:, :, 5]
-
-        era5_17h_2t = era5_17h[:, :, 0]
-        era5_17h_2d = era5_17h[:, :, 1]
-        era5_17h_100u = era5_17h[:, :, 2]
-        era5_17h_100v = era5_17h[:, :, 3]
-        era5_17h_tp = era5_17h[:, :, 4]
-        era5_17h_sp = era5_17h[:, :, 5]
-        
-        
-        era5_18h_2t = era5_18h[:, :, 0]
-        era5_18h_2d = era5_18h[:, :, 1]
-        era5_18h_100u = era5_18h[:, :, 2]
-        era5_18h_100v = era5_18h[:, :, 3]
-        era5_18h_tp = era5_18h[:, :, 4]
-        era5_18h_sp = era5_18h[:, :, 5]
-        
-        era5_19h_2t = era5_19h[:, :, 0]
-        era5_19h_2d = era5_19h[:, :, 1]
-        era5_19h_100u = era5_19h[:, :, 2]
-        era5_19h_100v = era5_19h[:, :, 3]
-        era5_19h_tp = era5_19h[:, :, 4]
-        era5_19h_sp = era5_19h[:, :, 5]
-        
-        era5_20h_2t = era5_20h[:, :, 0]
-        era5_20h_2d = era5_20h[:, :, 1]
-        era5_20h_100u = era5_20h[:, :, 2]
-        era5_20h_100v = era5_20h[:, :, 3]
-        era5_20h_tp = era5_20h[:, :, 4]
-        era5_20h_sp = era5_20h[:, :, 5]
-        
-        era5_21h_2t = era5_21h[:, :, 0]
-        era5_21h_2d = era5_21h[:, :, 1]
-        era5_21h_100u = era5_21h[:, :, 2]
-        era5_21h_100v = era5_21h[:, :, 3]
-        era5_21h_tp = era5_21h[:, :, 4]
-        era5_21h_sp = era5_21h[:, :, 5]
-        
-        era5_22h_2t = era5_22h[:, :, 0]
-        era5_22h_2d = era5_22h[:, :, 1]
-        era5_22h_100u = era5_22h[:, :, 2]
-        era5_22h_100v = era5_22h[:, :, 3]
-        era5_22h_tp = era5_22h[:, :, 4]
-        era5_22h_sp = era5_22h[:, :, 5]
-        
-        era5_23h_2t = era5_23h[:, :, 0]
-        era5_23h_2d = era5_23h[:, :, 1]
-        era5_23h_100u = era5_23h[:, :, 2]
-        era5_23h_100v = era5_23h[:, :, 3]
-        era5_23h_tp = era5_23h[:, :, 4]
-        era5_23h_sp = era5_23h[:, :, 5]
-        
-        era5_24h_2t = era5_24h[:, :, 0]
-        era5_24h_2d = era5_24h[:, :, 1]
-        era5_24h_100u = era5_24h[:, :, 2]
-        era5_24h_100v = era5_24h[:, :, 3]
-        era5_24h_tp = era5_24h[:, :, 4]
-        era5_24h_sp = era5_24h[:, :, 5]
-        
-
-        ens_aifs_1h_2t = ens_aifs_1h[:, :, 0]
-        ens_aifs_1h_2d = ens_aifs_1h[:, :, 1]
-        ens_aifs_1h_100u = ens_aifs_1h[:, :, 2]
-        ens_aifs_1h_100v = ens_aifs_1h[:, :, 3]
-        ens_aifs_1h_tp = ens_aifs_1h[:, :, 4]
-        ens_aifs_1h_sp = ens_aifs_1h[:, :, 5]
-        
-        ens_aifs_2h_2t = ens_aifs_2h[:, :, 0]
-        ens_aifs_2h_2d = ens_aifs_2h[:, :, 1]
-        ens_aifs_2h_100u = ens_aifs_2h[:, :, 2]
-        ens_aifs_2h_100v = ens_aifs_2h[:, :, 3]
-        ens_aifs_2h_tp = ens_aifs_2h[:, :, 4]
-        ens_aifs_2h_sp = ens_aifs_2h[:, :, 5]
-
-        ens_aifs_3h_2t = ens_aifs_3h[:, :, 0]
-        ens_aifs_3h_2d = ens_aifs_3h[:, :, 1]
-        ens_aifs_3h_100u = ens_aifs_3h[:, :, 2]
-        ens_aifs_3h_100v = ens_aifs_3h[:, :, 3]
-        ens_aifs_3h_tp = ens_aifs_3h[:, :, 4]
-        ens_aifs_3h_sp = ens_aifs_3h[:, :, 5]
-        
-        
-        ens_aifs_4h_2t = ens_aifs_4h[:, :, 0]
-        ens_aifs_4h_2d = ens_aifs_4h[:, :, 1]
-        ens_aifs_4h_100u = ens_aifs_4h[:, :, 2]
-        ens_aifs_4h_100v = ens_aifs_4h[:, :, 3]
-        ens_aifs_4h_tp = ens_aifs_4h[:, :, 4]
-        ens_aifs_4h_sp = ens_aifs_4h[:, :, 5]
-        
-        ens_aifs_5h_2t = ens_aifs_5h[:, :, 0]
-        ens_aifs_5h_2d = ens_aifs_5h[:, :, 1]
-        ens_aifs_5h_100u = ens_aifs_5h[:, :, 2]
-        ens_aifs_5h_100v = ens_aifs_5h[:, :, 3]
-        ens_aifs_5h_tp = ens_aifs_5h[:, :, 4]
-        ens_aifs_5h_sp = ens_aifs_5h[:, :, 5]
-        
-        ens_aifs_6h_2t = ens_aifs_6h[:, :, 0]
-        ens_aifs_6h_2d = ens_aifs_6h[:, :, 1]
-        ens_aifs_6h_100u = ens_aifs_6h[:, :, 2]
-        ens_aifs_6h_100v = ens_aifs_6h[:, :, 3]
-        ens_aifs_6h_tp = ens_aifs_6h[:, :, 4]
-        ens_aifs_6h_sp = ens_aifs_6h[:, :, 5]
-        
-        # Group features by hour and create one PNG per hour
-        ens_aifs_7h_2t = ens_aifs_7h[:, :, 0]
-        ens_aifs_7h_2d = ens_aifs_7h[:, :, 1]
-        ens_aifs_7h_100u = ens_aifs_7h[:, :, 2]
-        ens_aifs_7h_100v = ens_aifs_7h[:, :, 3]
-        ens_aifs_7h_tp = ens_aifs_7h[:, :, 4]
-        ens_aifs_7h_sp = ens_aifs_7h[:, :, 5]
-        
-        ens_aifs_8h_2t = ens_aifs_8h[:, :, 0]
-        ens_aifs_8h_2d = ens_aifs_8h[:, :, 1]
-        ens_aifs_8h_100u = ens_aifs_8h[:, :, 2]
-        ens_aifs_8h_100v = ens_aifs_8h[:, :, 3]
-        ens_aifs_8h_tp = ens_aifs_8h[:, :, 4]
-        ens_aifs_8h_sp = ens_aifs_8h[:, :, 5]
-        
-        ens_aifs_9h_2t = ens_aifs_9h[:, :, 0]
-        ens_aifs_9h_2d = ens_aifs_9h[:, :, 1]
-        ens_aifs_9h_100u = ens_aifs_9h[:, :, 2]
-        ens_aifs_9h_100v = ens_aifs_9h[:, :, 3]
-        ens_aifs_9h_tp = ens_aifs_9h[:, :, 4]
-        ens_aifs_9h_sp = ens_aifs_9h[:, :, 5]
-        
-        ens_aifs_10h_2t = ens_aifs_10h[:, :, 0]
-        ens_aifs_10h_2d = ens_aifs_10h[:, :, 1]
-        ens_aifs_10h_100u = ens_aifs_10h[:, :, 2]
-        ens_aifs_10h_100v = ens_aifs_10h[:, :, 3]
-        ens_aifs_10h_tp = ens_aifs_10h[:, :, 4]
-        ens_aifs_10h_sp = ens_aifs_10h[:, :, 5]
-        
-        ens_aifs_11h_2t = ens_aifs_11h[:, :, 0]
-        ens_aifs_11h_2d = ens_aifs_11h[:, :, 1]
-        ens_aifs_11h_100u = ens_aifs_11h[:, :, 2]
-        ens_aifs_11h_100v = ens_aifs_11h[:, :, 3]
-        ens_aifs_11h_tp = ens_aifs_11h[:, :, 4]
-        ens_aifs_11h_sp = ens_aifs_11h[:, :, 5]
-        
-        ens_aifs_12h_2t = ens_aifs_12h[:, :, 0]
-        ens_aifs_12h_2d = ens_aifs_12h[:, :, 1]
-        ens_aifs_12h_100u = ens_aifs_12h[:, :, 2]
-        ens_aifs_12h_100v = ens_aifs_12h[:, :, 3]
-        ens_aifs_12h_tp = ens_aifs_12h[:, :, 4]
-        ens_aifs_12h_sp = ens_aifs_12h[:, :, 5]
-        
-        ens_aifs_13h_2t = ens_aifs_13h[:, :, 0]
-        ens_aifs_13h_2d = ens_aifs_13h[:, :, 1]
-        ens_aifs_13h_100u = ens_aifs_13h[:, :, 2]
-        ens_aifs_13h_100v = ens_aifs_13h[:, :, 3]
-        ens_aifs_13h_tp = ens_aifs_13h[:, :, 4]
-        ens_aifs_13h_sp = ens_aifs_13h[:, :, 5]
-        
-        ens_aifs_14h_2t = ens_aifs_14h[:, :, 0]
-        ens_aifs_14h_2d = ens_aifs_14h[:, :, 1]
-        ens_aifs_14h_100u = ens_aifs_14h[:, :, 2]
-        ens_aifs_14h_100v = ens_aifs_14h[:, :, 3]
-        ens_aifs_14h_tp = ens_aifs_14h[:, :, 4]
-        ens_aifs_14h_sp = ens_aifs_14h[:, :, 5]
-        
-        ens_aifs_15h_2t = ens_aifs_15h[:, :, 0]
-        ens_aifs_15h_2d = ens_aifs_15h[:, :, 1]
-        ens_aifs_15h_100u = ens_aifs_15h[:, :, 2]
-        ens_aifs_15h_100v = ens_aifs_15h[:, :, 3]
-        ens_aifs_15h_tp = ens_aifs_15h[:, :, 4]
-        ens_aifs_15h_sp = ens_aifs_15h[:, :, 5]
-        
-        ens_aifs_16h_2t = ens_aifs_16h[:, :, 0]
-        ens_aifs_16h_2d = ens_aifs_16h[:, :, 1]
-        ens_aifs_16h_100u = ens_aifs_16h[:, :, 2]
-        ens_aifs_16h_100v = ens_aifs_16h[:, :, 3]
-        ens_aifs_16h_tp = ens_aifs_16h[:, :, 4]
-        ens_aifs_16h_sp = ens_aifs_16h[:, :, 5]
-        
-        ens_aifs_17h_2t = ens_aifs_17h[:, :, 0]
-        ens_aifs_17h_2d = ens_aifs_17h[:, :, 1]
-        ens_aifs_17h_100u = ens_aifs_17h[:, :, 2]
-        ens_aifs_17h_100v = ens_aifs_17h[:, :, 3]
-        ens_aifs_17h_tp = ens_aifs_17h[:, :, 4]
-        ens_aifs_17h_sp = ens_aifs_17h[:, :, 5]
-        
-        ens_aifs_18h_2t = ens_aifs_18h[:, :, 0]
-        ens_aifs_18h_2d = ens_aifs_18h[:, :, 1]
-        ens_aifs_18h_100u = ens_aifs_18h[:, :, 2]
-        ens_aifs_18h_100v = ens_aifs_18h[:, :, 3]
-        ens_aifs_18h_tp = ens_aifs_18h[:, :, 4]
-        ens_aifs_18h_sp = ens_aifs_18h[:, :, 5]
-        
-        ens_aifs_19h_2t = ens_aifs_19h[:, :, 0]
-        ens_aifs_19h_2d = ens_aifs_19h[:, :, 1]
-        ens_aifs_19h_100u = ens_aifs_19h[:, :, 2]
-        ens_aifs_19h_100v = ens_aifs_19h[:, :, 3]
-        ens_aifs_19h_tp = ens_aifs_19h[:, :, 4]
-        ens_aifs_19h_sp = ens_aifs_19h[:, :, 5]
-        
-        ens_aifs_20h_2t = ens_aifs_20h[:, :, 0]
-        ens_aifs_20h_2d = ens_aifs_20h[:, :, 1]
-        ens_aifs_20h_100u = ens_aifs_20h[:, :, 2]
-        ens_aifs_20h_100v = ens_aifs_20h[:, :, 3]
-        ens_aifs_20h_tp = ens_aifs_20h[:, :, 4]
-        ens_aifs_20h_sp = ens_aifs_20h[:, :, 5]
-        
-        ens_aifs_21h_2t = ens_aifs_21h[:, :, 0]
-        ens_aifs_21h_2d = ens_aifs_21h[:, :, 1]
-        ens_aifs_21h_100u = ens_aifs_21h[:, :, 2]
-        ens_aifs_21h_100v = ens_aifs_21h[:, :, 3]
-        ens_aifs_21h_tp = ens_aifs_21h[:, :, 4]
-        ens_aifs_21h_sp = ens_aifs_21h[:, :, 5]
-        
-        ens_aifs_22h_2t = ens_aifs_22h[:, :, 0]
-        ens_aifs_22h_2d = ens_aifs_22h[:, :, 1]
-        ens_aifs_22h_100u = ens_aifs_22h[:, :, 2]
-        ens_aifs_22h_100v = ens_aifs_22h[:, :, 3]
-        ens_aifs_22h_tp = ens_aifs_22h[:, :, 4]
-        ens_aifs_22h_sp = ens_aifs_22h[:, :, 5]
-        
-        ens_aifs_23h_2t = ens_aifs_23h[:, :, 0]
-        ens_aifs_23h_2d = ens_aifs_23h[:, :, 1]
-        ens_aifs_23h_100u = ens_aifs_23h[:, :, 2]
-        ens_aifs_23h_100v = ens_aifs_23h[:, :, 3]
-        ens_aifs_23h_tp = ens_aifs_23h[:, :, 4]
-        ens_aifs_23h_sp = ens_aifs_23h[:, :, 5]
-        
-        ens_aifs_24h_2t = ens_aifs_24h[:, :, 0]
-        ens_aifs_24h_2d = ens_aifs_24h[:, :, 1]
-        ens_aifs_24h_100u = ens_aifs_24h[:, :, 2]
-        ens_aifs_24h_100v = ens_aifs_24h[:, :, 3]
-        ens_aifs_24h_tp = ens_aifs_24h[:, :, 4]
-        ens_aifs_24h_sp = ens_aifs_24h[:, :, 5]
-
-
+        # Everything is loaded into the arrays: release the in-memory HDF5 files
+        # (shared with the prefetch result) and start deleting extracted files
+        # now, instead of holding both while the hours are rendered
+        h5_members.clear()
+        api_x_file = y_file = z_file = None
+        cleanup_extracted_files()
 
-        # Hours: 1h, 2h, 3h, 4h, 5h, 6h, 7h, 8h, 9h, 10h, 11h, 12h, 13h, 14h, 15h, 16h, 17h, 18h, 19h, 20h, 21h, 22h, 23h, 24h
-        hours_data = {
-            '1h': {
-                'best_match': [best_match_1h_2t, best_match_1h_2d, best_match_1h_100u, best_match_1h_100v, best_match_1h_tp, best_match_1h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_1h_2t, ecmwf_ifs_1h_2d, ecmwf_ifs_1h_100u, ecmwf_ifs_1h_100v, ecmwf_ifs_1h_tp, ecmwf_ifs_1h_sp],
-                'gfs_global': [gfs_global_1h_2t, gfs_global_1h_2d, gfs_global_1h_100u, gfs_global_1h_100v, gfs_global_1h_tp, gfs_global_1h_sp],
-                'AIFS': [AIFS_1h_2t, AIFS_1h_2d, AIFS_1h_100u, AIFS_1h_100v, AIFS_1h_tp, AIFS_1h_sp],
-                'CMA': [CMA_1h_2t, CMA_1h_2d, CMA_1h_100u, CMA_1h_100v, CMA_1h_tp, CMA_1h_sp],
-                'era5': [era5_1h_2t, era5_1h_2d, era5_1h_100u, era5_1h_100v, era5_1h_tp, era5_1h_sp],
-                'ens_aifs': [ens_aifs_1h_2t, ens_aifs_1h_2d, ens_aifs_1h_100u, ens_aifs_1h_100v, ens_aifs_1h_tp, ens_aifs_1h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '2h': {
-                'best_match': [best_match_2h_2t, best_match_2h_2d, best_match_2h_100u, best_match_2h_100v, best_match_2h_tp, best_match_2h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_2h_2t, ecmwf_ifs_2h_2d, ecmwf_ifs_2h_100u, ecmwf_ifs_2h_100v, ecmwf_ifs_2h_tp, ecmwf_ifs_2h_sp],
-                'gfs_global': [gfs_global_2h_2t, gfs_global_2h_2d, gfs_global_2h_100u, gfs_global_2h_100v, gfs_global_2h_tp, gfs_global_2h_sp],
-                'AIFS': [AIFS_2h_2t, AIFS_2h_2d, AIFS_2h_100u, AIFS_2h_100v, AIFS_2h_tp, AIFS_2h_sp],
-                'CMA': [CMA_2h_2t, CMA_2h_2d, CMA_2h_100u, CMA_2h_100v, CMA_2h_tp, CMA_2h_sp],
-                'era5': [era5_2h_2t, era5_2h_2d, era5_2h_100u, era5_2h_100v, era5_2h_tp, era5_2h_sp],
-                'ens_aifs': [ens_aifs_2h_2t, ens_aifs_2h_2d, ens_aifs_2h_100u, ens_aifs_2h_100v, ens_aifs_2h_tp, ens_aifs_2h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '3h': {
-                'best_match': [best_match_3h_2t, best_match_3h_2d, best_match_3h_100u, best_match_3h_100v, best_match_3h_tp, best_match_3h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_3h_2t, ecmwf_ifs_3h_2d, ecmwf_ifs_3h_100u, ecmwf_ifs_3h_100v, ecmwf_ifs_3h_tp, ecmwf_ifs_3h_sp],
-                'gfs_global': [gfs_global_3h_2t, gfs_global_3h_2d, gfs_global_3h_100u, gfs_global_3h_100v, gfs_global_3h_tp, gfs_global_3h_sp],
-                'AIFS': [AIFS_3h_2t, AIFS_3h_2d, AIFS_3h_100u, AIFS_3h_100v, AIFS_3h_tp, AIFS_3h_sp],
-                'CMA': [CMA_3h_2t, CMA_3h_2d, CMA_3h_100u, CMA_3h_100v, CMA_3h_tp, CMA_3h_sp],
-                'era5': [era5_3h_2t, era5_3h_2d, era5_3h_100u, era5_3h_100v, era5_3h_tp, era5_3h_sp],
-                'ens_aifs': [ens_aifs_3h_2t, ens_aifs_3h_2d, ens_aifs_3h_100u, ens_aifs_3h_100v, ens_aifs_3h_tp, ens_aifs_3h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '4h': {
-                'best_match': [best_match_4h_2t, best_match_4h_2d, best_match_4h_100u, best_match_4h_100v, best_match_4h_tp, best_match_4h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_4h_2t, ecmwf_ifs_4h_2d, ecmwf_ifs_4h_100u, ecmwf_ifs_4h_100v, ecmwf_ifs_4h_tp, ecmwf_ifs_4h_sp],
-                'gfs_global': [gfs_global_4h_2t, gfs_global_4h_2d, gfs_global_4h_100u, gfs_global_4h_100v, gfs_global_4h_tp, gfs_global_4h_sp],
-                'AIFS': [AIFS_4h_2t, AIFS_4h_2d, AIFS_4h_100u, AIFS_4h_100v, AIFS_4h_tp, AIFS_4h_sp],
-                'CMA': [CMA_4h_2t, CMA_4h_2d, CMA_4h_100u, CMA_4h_100v, CMA_4h_tp, CMA_4h_sp],
-                'era5': [era5_4h_2t, era5_4h_2d, era5_4h_100u, era5_4h_100v, era5_4h_tp, era5_4h_sp],
-                'ens_aifs': [ens_aifs_4h_2t, ens_aifs_4h_2d, ens_aifs_4h_100u, ens_aifs_4h_100v, ens_aifs_4h_tp, ens_aifs_4h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '5h': {
-                'best_match': [best_match_5h_2t, best_match_5h_2d, best_match_5h_100u, best_match_5h_100v, best_match_5h_tp, best_match_5h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_5h_2t, ecmwf_ifs_5h_2d, ecmwf_ifs_5h_100u, ecmwf_ifs_5h_100v, ecmwf_ifs_5h_tp, ecmwf_ifs_5h_sp],
-                'gfs_global': [gfs_global_5h_2t, gfs_global_5h_2d, gfs_global_5h_100u, gfs_global_5h_100v, gfs_global_5h_tp, gfs_global_5h_sp],
-                'AIFS': [AIFS_5h_2t, AIFS_5h_2d, AIFS_5h_100u, AIFS_5h_100v, AIFS_5h_tp, AIFS_5h_sp],
-                'CMA': [CMA_5h_2t, CMA_5h_2d, CMA_5h_100u, CMA_5h_100v, CMA_5h_tp, CMA_5h_sp],
-                'era5': [era5_5h_2t, era5_5h_2d, era5_5h_100u, era5_5h_100v, era5_5h_tp, era5_5h_sp],
-                'ens_aifs': [ens_aifs_5h_2t, ens_aifs_5h_2d, ens_aifs_5h_100u, ens_aifs_5h_100v, ens_aifs_5h_tp, ens_aifs_5h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '6h': {
-                'best_match': [best_match_6h_2t, best_match_6h_2d, best_match_6h_100u, best_match_6h_100v, best_match_6h_tp, best_match_6h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_6h_2t, ecmwf_ifs_6h_2d, ecmwf_ifs_6h_100u, ecmwf_ifs_6h_100v, ecmwf_ifs_6h_tp, ecmwf_ifs_6h_sp],
-                'gfs_global': [gfs_global_6h_2t, gfs_global_6h_2d, gfs_global_6h_100u, gfs_global_6h_100v, gfs_global_6h_tp, gfs_global_6h_sp],
-                'AIFS': [AIFS_6h_2t, AIFS_6h_2d, AIFS_6h_100u, AIFS_6h_100v, AIFS_6h_tp, AIFS_6h_sp],
-                'CMA': [CMA_6h_2t, CMA_6h_2d, CMA_6h_100u, CMA_6h_100v, CMA_6h_tp, CMA_6h_sp],
-                'era5': [era5_6h_2t, era5_6h_2d, era5_6h_100u, era5_6h_100v, era5_6h_tp, era5_6h_sp],
-                'ens_aifs': [ens_aifs_6h_2t, ens_aifs_6h_2d, ens_aifs_6h_100u, ens_aifs_6h_100v, ens_aifs_6h_tp, ens_aifs_6h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '7h': {
-                'best_match': [best_match_7h_2t, best_match_7h_2d, best_match_7h_100u, best_match_7h_100v, best_match_7h_tp, best_match_7h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_7h_2t, ecmwf_ifs_7h_2d, ecmwf_ifs_7h_100u, ecmwf_ifs_7h_100v, ecmwf_ifs_7h_tp, ecmwf_ifs_7h_sp],
-                'gfs_global': [gfs_global_7h_2t, gfs_global_7h_2d, gfs_global_7h_100u, gfs_global_7h_100v, gfs_global_7h_tp, gfs_global_7h_sp],
-                'AIFS': [AIFS_7h_2t, AIFS_7h_2d, AIFS_7h_100u, AIFS_7h_100v, AIFS_7h_tp, AIFS_7h_sp],
-                'CMA': [CMA_7h_2t, CMA_7h_2d, CMA_7h_100u, CMA_7h_100v, CMA_7h_tp, CMA_7h_sp],
-                'era5': [era5_7h_2t, era5_7h_2d, era5_7h_100u, era5_7h_100v, era5_7h_tp, era5_7h_sp],
-                'ens_aifs': [ens_aifs_7h_2t, ens_aifs_7h_2d, ens_aifs_7h_100u, ens_aifs_7h_100v, ens_aifs_7h_tp, ens_aifs_7h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '8h': {
-                'best_match': [best_match_8h_2t, best_match_8h_2d, best_match_8h_100u, best_match_8h_100v, best_match_8h_tp, best_match_8h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_8h_2t, ecmwf_ifs_8h_2d, ecmwf_ifs_8h_100u, ecmwf_ifs_8h_100v, ecmwf_ifs_8h_tp, ecmwf_ifs_8h_sp],
-                'gfs_global': [gfs_global_8h_2t, gfs_global_8h_2d, gfs_global_8h_100u, gfs_global_8h_100v, gfs_global_8h_tp, gfs_global_8h_sp],
-                'AIFS': [AIFS_8h_2t, AIFS_8h_2d, AIFS_8h_100u, AIFS_8h_100v, AIFS_8h_tp, AIFS_8h_sp],
-                'CMA': [CMA_8h_2t, CMA_8h_2d, CMA_8h_100u, CMA_8h_100v, CMA_8h_tp, CMA_8h_sp],
-                'era5': [era5_8h_2t, era5_8h_2d, era5_8h_100u, era5_8h_100v, era5_8h_tp, era5_8h_sp],
-                'ens_aifs': [ens_aifs_8h_2t, ens_aifs_8h_2d, ens_aifs_8h_100u, ens_aifs_8h_100v, ens_aifs_8h_tp, ens_aifs_8h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '9h': {
-                'best_match': [best_match_9h_2t, best_match_9h_2d, best_match_9h_100u, best_match_9h_100v, best_match_9h_tp, best_match_9h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_9h_2t, ecmwf_ifs_9h_2d, ecmwf_ifs_9h_100u, ecmwf_ifs_9h_100v, ecmwf_ifs_9h_tp, ecmwf_ifs_9h_sp],
-                'gfs_global': [gfs_global_9h_2t, gfs_global_9h_2d, gfs_global_9h_100u, gfs_global_9h_100v, gfs_global_9h_tp, gfs_global_9h_sp],
-                'AIFS': [AIFS_9h_2t, AIFS_9h_2d, AIFS_9h_100u, AIFS_9h_100v, AIFS_9h_tp, AIFS_9h_sp],
-                'CMA': [CMA_9h_2t, CMA_9h_2d, CMA_9h_100u, CMA_9h_100v, CMA_9h_tp, CMA_9h_sp],
-                'era5': [era5_9h_2t, era5_9h_2d, era5_9h_100u, era5_9h_100v, era5_9h_tp, era5_9h_sp],
-                'ens_aifs': [ens_aifs_9h_2t, ens_aifs_9h_2d, ens_aifs_9h_100u, ens_aifs_9h_100v, ens_aifs_9h_tp, ens_aifs_9h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '10h': {
-                'best_match': [best_match_10h_2t, best_match_10h_2d, best_match_10h_100u, best_match_10h_100v, best_match_10h_tp, best_match_10h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_10h_2t, ecmwf_ifs_10h_2d, ecmwf_ifs_10h_100u, ecmwf_ifs_10h_100v, ecmwf_ifs_10h_tp, ecmwf_ifs_10h_sp],
-                'gfs_global': [gfs_global_10h_2t, gfs_global_10h_2d, gfs_global_10h_100u, gfs_global_10h_100v, gfs_global_10h_tp, gfs_global_10h_sp],
-                'AIFS': [AIFS_10h_2t, AIFS_10h_2d, AIFS_10h_100u, AIFS_10h_100v, AIFS_10h_tp, AIFS_10h_sp],
-                'CMA': [CMA_10h_2t, CMA_10h_2d, CMA_10h_100u, CMA_10h_100v, CMA_10h_tp, CMA_10h_sp],
-                'era5': [era5_10h_2t, era5_10h_2d, era5_10h_100u, era5_10h_100v, era5_10h_tp, era5_10h_sp],
-                'ens_aifs': [ens_aifs_10h_2t, ens_aifs_10h_2d, ens_aifs_10h_100u, ens_aifs_10h_100v, ens_aifs_10h_tp, ens_aifs_10h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '11h': {
-                'best_match': [best_match_11h_2t, best_match_11h_2d, best_match_11h_100u, best_match_11h_100v, best_match_11h_tp, best_match_11h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_11h_2t, ecmwf_ifs_11h_2d, ecmwf_ifs_11h_100u, ecmwf_ifs_11h_100v, ecmwf_ifs_11h_tp, ecmwf_ifs_11h_sp],
-                'gfs_global': [gfs_global_11h_2t, gfs_global_11h_2d, gfs_global_11h_100u, gfs_global_11h_100v, gfs_global_11h_tp, gfs_global_11h_sp],
-                'AIFS': [AIFS_11h_2t, AIFS_11h_2d, AIFS_11h_100u, AIFS_11h_100v, AIFS_11h_tp, AIFS_11h_sp],
-                'CMA': [CMA_11h_2t, CMA_11h_2d, CMA_11h_100u, CMA_11h_100v, CMA_11h_tp, CMA_11h_sp],
-                'era5': [era5_11h_2t, era5_11h_2d, era5_11h_100u, era5_11h_100v, era5_11h_tp, era5_11h_sp],
-                'ens_aifs': [ens_aifs_11h_2t, ens_aifs_11h_2d, ens_aifs_11h_100u, ens_aifs_11h_100v, ens_aifs_11h_tp, ens_aifs_11h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '12h': {
-                'best_match': [best_match_12h_2t, best_match_12h_2d, best_match_12h_100u, best_match_12h_100v, best_match_12h_tp, best_match_12h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_12h_2t, ecmwf_ifs_12h_2d, ecmwf_ifs_12h_100u, ecmwf_ifs_12h_100v, ecmwf_ifs_12h_tp, ecmwf_ifs_12h_sp],
-                'gfs_global': [gfs_global_12h_2t, gfs_global_12h_2d, gfs_global_12h_100u, gfs_global_12h_100v, gfs_global_12h_tp, gfs_global_12h_sp],
-                'AIFS': [AIFS_12h_2t, AIFS_12h_2d, AIFS_12h_100u, AIFS_12h_100v, AIFS_12h_tp, AIFS_12h_sp],
-                'CMA': [CMA_12h_2t, CMA_12h_2d, CMA_12h_100u, CMA_12h_100v, CMA_12h_tp, CMA_12h_sp],
-                'era5': [era5_12h_2t, era5_12h_2d, era5_12h_100u, era5_12h_100v, era5_12h_tp, era5_12h_sp],
-                'ens_aifs': [ens_aifs_12h_2t, ens_aifs_12h_2d, ens_aifs_12h_100u, ens_aifs_12h_100v, ens_aifs_12h_tp, ens_aifs_12h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '13h': {
-                'best_match': [best_match_13h_2t, best_match_13h_2d, best_match_13h_100u, best_match_13h_100v, best_match_13h_tp, best_match_13h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_13h_2t, ecmwf_ifs_13h_2d, ecmwf_ifs_13h_100u, ecmwf_ifs_13h_100v, ecmwf_ifs_13h_tp, ecmwf_ifs_13h_sp],
-                'gfs_global': [gfs_global_13h_2t, gfs_global_13h_2d, gfs_global_13h_100u, gfs_global_13h_100v, gfs_global_13h_tp, gfs_global_13h_sp],
-                'AIFS': [AIFS_13h_2t, AIFS_13h_2d, AIFS_13h_100u, AIFS_13h_100v, AIFS_13h_tp, AIFS_13h_sp],
-                'CMA': [CMA_13h_2t, CMA_13h_2d, CMA_13h_100u, CMA_13h_100v, CMA_13h_tp, CMA_13h_sp],
-                'era5': [era5_13h_2t, era5_13h_2d, era5_13h_100u, era5_13h_100v, era5_13h_tp, era5_13h_sp],
-                'ens_aifs': [ens_aifs_13h_2t, ens_aifs_13h_2d, ens_aifs_13h_100u, ens_aifs_13h_100v, ens_aifs_13h_tp, ens_aifs_13h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '14h': {
-                'best_match': [best_match_14h_2t, best_match_14h_2d, best_match_14h_100u, best_match_14h_100v, best_match_14h_tp, best_match_14h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_14h_2t, ecmwf_ifs_14h_2d, ecmwf_ifs_14h_100u, ecmwf_ifs_14h_100v, ecmwf_ifs_14h_tp, ecmwf_ifs_14h_sp],
-                'gfs_global': [gfs_global_14h_2t, gfs_global_14h_2d, gfs_global_14h_100u, gfs_global_14h_100v, gfs_global_14h_tp, gfs_global_14h_sp],
-                'AIFS': [AIFS_14h_2t, AIFS_14h_2d, AIFS_14h_100u, AIFS_14h_100v, AIFS_14h_tp, AIFS_14h_sp],
-                'CMA': [CMA_14h_2t, CMA_14h_2d, CMA_14h_100u, CMA_14h_100v, CMA_14h_tp, CMA_14h_sp],
-                'era5': [era5_14h_2t, era5_14h_2d, era5_14h_100u, era5_14h_100v, era5_14h_tp, era5_14h_sp],
-                'ens_aifs': [ens_aifs_14h_2t, ens_aifs_14h_2d, ens_aifs_14h_100u, ens_aifs_14h_100v, ens_aifs_14h_tp, ens_aifs_14h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '15h': {
-                'best_match': [best_match_15h_2t, best_match_15h_2d, best_match_15h_100u, best_match_15h_100v, best_match_15h_tp, best_match_15h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_15h_2t, ecmwf_ifs_15h_2d, ecmwf_ifs_15h_100u, ecmwf_ifs_15h_100v, ecmwf_ifs_15h_tp, ecmwf_ifs_15h_sp],
-                'gfs_global': [gfs_global_15h_2t, gfs_global_15h_2d, gfs_global_15h_100u, gfs_global_15h_100v, gfs_global_15h_tp, gfs_global_15h_sp],
-                'AIFS': [AIFS_15h_2t, AIFS_15h_2d, AIFS_15h_100u, AIFS_15h_100v, AIFS_15h_tp, AIFS_15h_sp],
-                'CMA': [CMA_15h_2t, CMA_15h_2d, CMA_15h_100u, CMA_15h_100v, CMA_15h_tp, CMA_15h_sp],
-                'era5': [era5_15h_2t, era5_15h_2d, era5_15h_100u, era5_15h_100v, era5_15h_tp, era5_15h_sp],
-                'ens_aifs': [ens_aifs_15h_2t, ens_aifs_15h_2d, ens_aifs_15h_100u, ens_aifs_15h_100v, ens_aifs_15h_tp, ens_aifs_15h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '16h': {
-                'best_match': [best_match_16h_2t, best_match_16h_2d, best_match_16h_100u, best_match_16h_100v, best_match_16h_tp, best_match_16h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_16h_2t, ecmwf_ifs_16h_2d, ecmwf_ifs_16h_100u, ecmwf_ifs_16h_100v, ecmwf_ifs_16h_tp, ecmwf_ifs_16h_sp],
-                'gfs_global': [gfs_global_16h_2t, gfs_global_16h_2d, gfs_global_16h_100u, gfs_global_16h_100v, gfs_global_16h_tp, gfs_global_16h_sp],
-                'AIFS': [AIFS_16h_2t, AIFS_16h_2d, AIFS_16h_100u, AIFS_16h_100v, AIFS_16h_tp, AIFS_16h_sp],
-                'CMA': [CMA_16h_2t, CMA_16h_2d, CMA_16h_100u, CMA_16h_100v, CMA_16h_tp, CMA_16h_sp],
-                'era5': [era5_16h_2t, era5_16h_2d, era5_16h_100u, era5_16h_100v, era5_16h_tp, era5_16h_sp],
-                'ens_aifs': [ens_aifs_16h_2t, ens_aifs_16h_2d, ens_aifs_16h_100u, ens_aifs_16h_100v, ens_aifs_16h_tp, ens_aifs_16h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '17h': {
-                'best_match': [best_match_17h_2t, best_match_17h_2d, best_match_17h_100u, best_match_17h_100v, best_match_17h_tp, best_match_17h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_17h_2t, ecmwf_ifs_17h_2d, ecmwf_ifs_17h_100u, ecmwf_ifs_17h_100v, ecmwf_ifs_17h_tp, ecmwf_ifs_17h_sp],
-                'gfs_global': [gfs_global_17h_2t, gfs_global_17h_2d, gfs_global_17h_100u, gfs_global_17h_100v, gfs_global_17h_tp, gfs_global_17h_sp],
-                'AIFS': [AIFS_17h_2t, AIFS_17h_2d, AIFS_17h_100u, AIFS_17h_100v, AIFS_17h_tp, AIFS_17h_sp],
-                'CMA': [CMA_17h_2t, CMA_17h_2d, CMA_17h_100u, CMA_17h_100v, CMA_17h_tp, CMA_17h_sp],
-                'era5': [era5_17h_2t, era5_17h_2d, era5_17h_100u, era5_17h_100v, era5_17h_tp, era5_17h_sp],
-                'ens_aifs': [ens_aifs_17h_2t, ens_aifs_17h_2d, ens_aifs_17h_100u, ens_aifs_17h_100v, ens_aifs_17h_tp, ens_aifs_17h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '18h': {
-                'best_match': [best_match_18h_2t, best_match_18h_2d, best_match_18h_100u, best_match_18h_100v, best_match_18h_tp, best_match_18h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_18h_2t, ecmwf_ifs_18h_2d, ecmwf_ifs_18h_100u, ecmwf_ifs_18h_100v, ecmwf_ifs_18h_tp, ecmwf_ifs_18h_sp],
-                'gfs_global': [gfs_global_18h_2t, gfs_global_18h_2d, gfs_global_18h_100u, gfs_global_18h_100v, gfs_global_18h_tp, gfs_global_18h_sp],
-                'AIFS': [AIFS_18h_2t, AIFS_18h_2d, AIFS_18h_100u, AIFS_18h_100v, AIFS_18h_tp, AIFS_18h_sp],
-                'CMA': [CMA_18h_2t, CMA_18h_2d, CMA_18h_100u, CMA_18h_100v, CMA_18h_tp, CMA_18h_sp],
-                'era5': [era5_18h_2t, era5_18h_2d, era5_18h_100u, era5_18h_100v, era5_18h_tp, era5_18h_sp],
-                'ens_aifs': [ens_aifs_18h_2t, ens_aifs_18h_2d, ens_aifs_18h_100u, ens_aifs_18h_100v, ens_aifs_18h_tp, ens_aifs_18h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '19h': {
-                'best_match': [best_match_19h_2t, best_match_19h_2d, best_match_19h_100u, best_match_19h_100v, best_match_19h_tp, best_match_19h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_19h_2t, ecmwf_ifs_19h_2d, ecmwf_ifs_19h_100u, ecmwf_ifs_19h_100v, ecmwf_ifs_19h_tp, ecmwf_ifs_19h_sp],
-                'gfs_global': [gfs_global_19h_2t, gfs_global_19h_2d, gfs_global_19h_100u, gfs_global_19h_100v, gfs_global_19h_tp, gfs_global_19h_sp],
-                'AIFS': [AIFS_19h_2t, AIFS_19h_2d, AIFS_19h_100u, AIFS_19h_100v, AIFS_19h_tp, AIFS_19h_sp],
-                'CMA': [CMA_19h_2t, CMA_19h_2d, CMA_19h_100u, CMA_19h_100v, CMA_19h_tp, CMA_19h_sp],
-                'era5': [era5_19h_2t, era5_19h_2d, era5_19h_100u, era5_19h_100v, era5_19h_tp, era5_19h_sp],
-                'ens_aifs': [ens_aifs_19h_2t, ens_aifs_19h_2d, ens_aifs_19h_100u, ens_aifs_19h_100v, ens_aifs_19h_tp, ens_aifs_19h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '20h': {
-                'best_match': [best_match_20h_2t, best_match_20h_2d, best_match_20h_100u, best_match_20h_100v, best_match_20h_tp, best_match_20h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_20h_2t, ecmwf_ifs_20h_2d, ecmwf_ifs_20h_100u, ecmwf_ifs_20h_100v, ecmwf_ifs_20h_tp, ecmwf_ifs_20h_sp],
-                'gfs_global': [gfs_global_20h_2t, gfs_global_20h_2d, gfs_global_20h_100u, gfs_global_20h_100v, gfs_global_20h_tp, gfs_global_20h_sp],
-                'AIFS': [AIFS_20h_2t, AIFS_20h_2d, AIFS_20h_100u, AIFS_20h_100v, AIFS_20h_tp, AIFS_20h_sp],
-                'CMA': [CMA_20h_2t, CMA_20h_2d, CMA_20h_100u, CMA_20h_100v, CMA_20h_tp, CMA_20h_sp],
-                'era5': [era5_20h_2t, era5_20h_2d, era5_20h_100u, era5_20h_100v, era5_20h_tp, era5_20h_sp],
-                'ens_aifs': [ens_aifs_20h_2t, ens_aifs_20h_2d, ens_aifs_20h_100u, ens_aifs_20h_100v, ens_aifs_20h_tp, ens_aifs_20h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '21h': {
-                'best_match': [best_match_21h_2t, best_match_21h_2d, best_match_21h_100u, best_match_21h_100v, best_match_21h_tp, best_match_21h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_21h_2t, ecmwf_ifs_21h_2d, ecmwf_ifs_21h_100u, ecmwf_ifs_21h_100v, ecmwf_ifs_21h_tp, ecmwf_ifs_21h_sp],
-                'gfs_global': [gfs_global_21h_2t, gfs_global_21h_2d, gfs_global_21h_100u, gfs_global_21h_100v, gfs_global_21h_tp, gfs_global_21h_sp],
-                'AIFS': [AIFS_21h_2t, AIFS_21h_2d, AIFS_21h_100u, AIFS_21h_100v, AIFS_21h_tp, AIFS_21h_sp],
-                'CMA': [CMA_21h_2t, CMA_21h_2d, CMA_21h_100u, CMA_21h_100v, CMA_21h_tp, CMA_21h_sp],
-                'era5': [era5_21h_2t, era5_21h_2d, era5_21h_100u, era5_21h_100v, era5_21h_tp, era5_21h_sp],
-                'ens_aifs': [ens_aifs_21h_2t, ens_aifs_21h_2d, ens_aifs_21h_100u, ens_aifs_21h_100v, ens_aifs_21h_tp, ens_aifs_21h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '22h': {
-                'best_match': [best_match_22h_2t, best_match_22h_2d, best_match_22h_100u, best_match_22h_100v, best_match_22h_tp, best_match_22h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_22h_2t, ecmwf_ifs_22h_2d, ecmwf_ifs_22h_100u, ecmwf_ifs_22h_100v, ecmwf_ifs_22h_tp, ecmwf_ifs_22h_sp],
-                'gfs_global': [gfs_global_22h_2t, gfs_global_22h_2d, gfs_global_22h_100u, gfs_global_22h_100v, gfs_global_22h_tp, gfs_global_22h_sp],
-                'AIFS': [AIFS_22h_2t, AIFS_22h_2d, AIFS_22h_100u, AIFS_22h_100v, AIFS_22h_tp, AIFS_22h_sp],
-                'CMA': [CMA_22h_2t, CMA_22h_2d, CMA_22h_100u, CMA_22h_100v, CMA_22h_tp, CMA_22h_sp],
-                'era5': [era5_22h_2t, era5_22h_2d, era5_22h_100u, era5_22h_100v, era5_22h_tp, era5_22h_sp],
-                'ens_aifs': [ens_aifs_22h_2t, ens_aifs_22h_2d, ens_aifs_22h_100u, ens_aifs_22h_100v, ens_aifs_22h_tp, ens_aifs_22h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '23h': {
-                'best_match': [best_match_23h_2t, best_match_23h_2d, best_match_23h_100u, best_match_23h_100v, best_match_23h_tp, best_match_23h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_23h_2t, ecmwf_ifs_23h_2d, ecmwf_ifs_23h_100u, ecmwf_ifs_23h_100v, ecmwf_ifs_23h_tp, ecmwf_ifs_23h_sp],
-                'gfs_global': [gfs_global_23h_2t, gfs_global_23h_2d, gfs_global_23h_100u, gfs_global_23h_100v, gfs_global_23h_tp, gfs_global_23h_sp],
-                'AIFS': [AIFS_23h_2t, AIFS_23h_2d, AIFS_23h_100u, AIFS_23h_100v, AIFS_23h_tp, AIFS_23h_sp],
-                'CMA': [CMA_23h_2t, CMA_23h_2d, CMA_23h_100u, CMA_23h_100v, CMA_23h_tp, CMA_23h_sp],
-                'era5': [era5_23h_2t, era5_23h_2d, era5_23h_100u, era5_23h_100v, era5_23h_tp, era5_23h_sp],
-                'ens_aifs': [ens_aifs_23h_2t, ens_aifs_23h_2d, ens_aifs_23h_100u, ens_aifs_23h_100v, ens_aifs_23h_tp, ens_aifs_23h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            },
-            '24h': {
-                'best_match': [best_match_24h_2t, best_match_24h_2d, best_match_24h_100u, best_match_24h_100v, best_match_24h_tp, best_match_24h_sp],
-                'ecmwf_ifs': [ecmwf_ifs_24h_2t, ecmwf_ifs_24h_2d, ecmwf_ifs_24h_100u, ecmwf_ifs_24h_100v, ecmwf_ifs_24h_tp, ecmwf_ifs_24h_sp],
-                'gfs_global': [gfs_global_24h_2t, gfs_global_24h_2d, gfs_global_24h_100u, gfs_global_24h_100v, gfs_global_24h_tp, gfs_global_24h_sp],
-                'AIFS': [AIFS_24h_2t, AIFS_24h_2d, AIFS_24h_100u, AIFS_24h_100v, AIFS_24h_tp, AIFS_24h_sp],
-                'CMA': [CMA_24h_2t, CMA_24h_2d, CMA_24h_100u, CMA_24h_100v, CMA_24h_tp, CMA_24h_sp],
-                'era5': [era5_24h_2t, era5_24h_2d, era5_24h_100u, era5_24h_100v, era5_24h_tp, era5_24h_sp],
-                'ens_aifs': [ens_aifs_24h_2t, ens_aifs_24h_2d, ens_aifs_24h_100u, ens_aifs_24h_100v, ens_aifs_24h_tp, ens_aifs_24h_sp],
-                'feature_names': ['temperature_2t', 'dewpoint_2d', 'u100_100u', 'v100_100v', 'precipitation_tp', 'sp']
-            }
-        }
+        if ens_aifs is not None and ens_aifs.ndim == era5.ndim + 1 and ens_aifs.shape[2] == 1:
+            ens_aifs = ens_aifs.squeeze(axis = 2)
+        if ens_aifs is not None and ens_aifs.shape != era5.shape:
+            print(f"Warning: z.h5 data has shape {ens_aifs.shape} after reading, expected {era5.shape}")
+            print("Continuing without ens_aifs data.")
+            ens_aifs = None
+        if ens_aifs is None:
+            # Without z.h5 the ENS AIFS panels are left empty: a read-only NaN
+            # array of the ERA5 shape, broadcast from a single value
+            ens_aifs = np.broadcast_to(np.float32(np.nan), era5.shape)
 
-        
-        # Use diverging colormap for better contrast
-        cmap = 'RdBu_r'  # or 'coolwarm', 'seismic', 'bwr'
-        
-        # Process each hour separately
-        try:
-            for hour in ['1h', '2h', '3h', '4h', '5h', '6h', '7h', '8h', '9h', '10h', '11h', '12h', '13h', '14h', '15h', '16h', '17h', '18h', '19h', '20h', '21h', '22h', '23h', '24h']:
-                hour_data = hours_data[hour]
-                
-                # Check if PNG already exists for this hour
+        # data_3 is read as (hour, variable, model, lat, lon) and era5/ens_aifs as
+        # (hour, variable, lat, lon): every (lat, lon) plane is already contiguous,
+        # so the per-hour inputs are plain views indexed from these arrays
+        def pending_jobs():
+            """Yield the render_hour arguments of each hour whose PNG still has to be rendered."""
+            for hour, hour_data in iter_hours(data_3, era5, ens_aifs, first_hour):
+                # Check if PNG already exists for this hour (output directory listed above)
                 output_path = os.path.join(rar_output_dir, f'{rar_basename}_{hour}.png')
-                if os.path.exists(output_path):
+                if existing_files and os.path.basename(output_path) in existing_files:
                     print(f"PNG file already exists: {output_path}, skipping...")
                     continue
-                
-                # Create figure with 6 rows (features) and 5 columns (models)
-                fig, axes = plt.subplots(6, 6, figsize=(18, 36))
-                
-                # Process each feature for this hour
-                for row_idx in range(6):
-                    best_match_data = hour_data['best_match'][row_idx]
-                    ecmwf_ifs_data = hour_data['ecmwf_ifs'][row_idx]
-                    gfs_global_data = hour_data['gfs_global'][row_idx]
-                    AIFS_data = hour_data['AIFS'][row_idx]
-                    CMA_data = hour_data['CMA'][row_idx]
-                    era5_data = hour_data['era5'][row_idx]
-                    ens_aifs_data = hour_data['ens_aifs'][row_idx]
-                    feature_name = hour_data['feature_names'][row_idx]
-                    
-                    # Calculate RMSE for each model
-                    rmse_best_match = np.flip(np.abs(best_match_data - era5_data), axis=0)
-                    rmse_ecmwf_ifs = np.flip(np.abs(ecmwf_ifs_data - era5_data), axis=0)
-                    rmse_gfs_global = np.flip(np.abs(gfs_global_data - era5_data), axis=0)
-                    rmse_AIFS = np.flip(np.abs(AIFS_data - era5_data), axis=0)
-                    rmse_CMA = np.flip(np.abs(CMA_data - era5_data), axis=0)
-                    rmse_ens_aifs = np.flip(np.abs(ens_aifs_data - era5_data), axis=0)
-                    
-                    global_rmse_ecmwf_ifs = np.sqrt(np.mean(rmse_ecmwf_ifs ** 2))
-                    global_rmse_best_match = np.sqrt(np.mean(rmse_best_match ** 2)) - global_rmse_ecmwf_ifs
-                    global_rmse_gfs_global = np.sqrt(np.mean(rmse_gfs_global ** 2)) - global_rmse_ecmwf_ifs
-                    global_rmse_AIFS = np.sqrt(np.mean(rmse_AIFS ** 2)) - global_rmse_ecmwf_ifs
-                    global_rmse_CMA = np.sqrt(np.mean(rmse_CMA ** 2)) - global_rmse_ecmwf_ifs
-                    global_rmse_ens_aifs = np.sqrt(np.mean(rmse_ens_aifs ** 2)) - global_rmse_ecmwf_ifs
-                    
-                    # Calculate differences relative to ECMWF
-                    data1 = rmse_best_match - rmse_ecmwf_ifs
-                    data3 = rmse_gfs_global - rmse_ecmwf_ifs
-                    data4 = rmse_AIFS - rmse_ecmwf_ifs
-                    data5 = rmse_CMA - rmse_ecmwf_ifs
-                    data6 = rmse_ens_aifs - rmse_ecmwf_ifs
-                    
-                    # Find global min/max for symmetric color scaling
-                    vmax = max(np.abs(data1).max(), np.abs(data3).max(), np.abs(data4).max(), np.abs(data5).max(), np.abs(data6).max())
-                    vmin = -vmax
-                    
-                    # Plot with symmetric color scaling
-                    im0 = axes[row_idx, 0].imshow(data1, cmap=cmap, vmin=vmin, vmax=vmax)
-                    axes[row_idx, 0].set_title(f'{feature_name} ({hour})\nBest Match - ECMWF\n(relative to ERA5)')
-                    axes[row_idx, 0].axis('off')
-                    axes[row_idx, 0].text(0.5, -0.08, f'Global RMSE: {global_rmse_best_match:.4f}', 
-                                          transform=axes[row_idx, 0].transAxes, ha='center', va='top', fontsize=9)
-                    
-                    # Second plot shows absolute ECMWF RMSE
-                    im1 = axes[row_idx, 1].imshow(rmse_ecmwf_ifs, cmap='viridis')
-                    axes[row_idx, 1].set_title(f'{feature_name} ({hour})\nECMWF RMSE\n(absolute values)')
-                    axes[row_idx, 1].axis('off')
-                    axes[row_idx, 1].text(0.5, -0.08, f'Global RMSE: {global_rmse_ecmwf_ifs:.4f}', 
-                                          transform=axes[row_idx, 1].transAxes, ha='center', va='top', fontsize=9)
-                    
-                    im2 = axes[row_idx, 2].imshow(data3, cmap=cmap, vmin=vmin, vmax=vmax)
-                    axes[row_idx, 2].set_title(f'{feature_name} ({hour})\nGFS Global - ECMWF\n(relative to ERA5)')
-                    axes[row_idx, 2].axis('off')
-                    axes[row_idx, 2].text(0.5, -0.08, f'Global RMSE: {global_rmse_gfs_global:.4f}', 
-                                          transform=axes[row_idx, 2].transAxes, ha='center', va='top', fontsize=9)
-                    
-                    im3 = axes[row_idx, 3].imshow(data4, cmap=cmap, vmin=vmin, vmax=vmax)
-                    axes[row_idx, 3].set_title(f'{feature_name} ({hour})\nAIFS - ECMWF\n(relative to ERA5)')
-                    axes[row_idx, 3].axis('off')
-                    axes[row_idx, 3].text(0.5, -0.08, f'Global RMSE: {global_rmse_AIFS:.4f}', 
-                                          transform=axes[row_idx, 3].transAxes, ha='center', va='top', fontsize=9)
-                    
-                    im4 = axes[row_idx, 4].imshow(data5, cmap=cmap, vmin=vmin, vmax=vmax)
-                    axes[row_idx, 4].set_title(f'{feature_name} ({hour})\nCMA - ECMWF\n(relative to ERA5)')
-                    axes[row_idx, 4].axis('off')
-                    axes[row_idx, 4].text(0.5, -0.08, f'Global RMSE: {global_rmse_CMA:.4f}', 
-                                          transform=axes[row_idx, 4].transAxes, ha='center', va='top', fontsize=9)
-                    im5 = axes[row_idx, 5].imshow(data6, cmap=cmap, vmin=vmin, vmax=vmax)
-                    axes[row_idx, 5].set_title(f'{feature_name} ({hour})\nENS AIFS - ECMWF\n(relative to ERA5)')
-                    axes[row_idx, 5].axis('off')
-                    axes[row_idx, 5].text(0.5, -0.08, f'Global RMSE: {global_rmse_ens_aifs:.4f}', 
-                                          transform=axes[row_idx, 5].transAxes, ha='center', va='top', fontsize=9)
+                yield hour, hour_data, output_path
 
-                    # Add colorbars
-                    fig.colorbar(im0, ax=axes[row_idx, 0], fraction=0.046, pad=0.04)
-                    fig.colorbar(im1, ax=axes[row_idx, 1], fraction=0.046, pad=0.04)
-                    fig.colorbar(im2, ax=axes[row_idx, 2], fraction=0.046, pad=0.04)
-                    fig.colorbar(im3, ax=axes[row_idx, 3], fraction=0.046, pad=0.04)
-                    fig.colorbar(im4, ax=axes[row_idx, 4], fraction=0.046, pad=0.04)
-                    fig.colorbar(im5, ax=axes[row_idx, 5], fraction=0.046, pad=0.04)
-                
-                plt.tight_layout(rect=[0, 0.03, 1, 0.98])  # Leave space at bottom for global RMSE text
-                plt.subplots_adjust(bottom=0.05)  # Additional bottom margin for text
-                
-                # Save the PNG file for this hour
-                try:
-                    # Ensure output directory exists
-                    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-                    print(f"Saved heatmap to: {output_path}")
-                except Exception as e:
-                    print(f"Error saving PNG file {output_path}: {e}")
-                    cleanup_extracted_files()
-                    return False
-                finally:
-                    # Close the figure to free memory
-                    if fig is not None:
-                        try:
-                            plt.close(fig)
-                        except:
-                            pass
-                    fig = None
-        
+        # Process each hour separately; hours are independent, so render them in
+        # parallel worker processes when an executor is given
+        futures = []
+        try:
+            if executor is not None:
+                for job in pending_jobs():
+                    futures.append(executor.submit(render_hour, *job))
+                for future in futures:
+                    print(f"Saved heatmap to: {future.result()}")
+            else:
+                for job in pending_jobs():
+                    print(f"Saved heatmap to: {render_hour(*job)}")
+        
+        except BrokenProcessPool:
+            # A worker process died (e.g. killed for lack of memory): the pool
+            # cannot be used any more, the caller has to replace it
+            for future in futures:
+                future.cancel()
+            raise
         except Exception as e:
+            # Don't let the remaining hours render on behind the next RAR file
+            for future in futures:
+                future.cancel()
             print(f"Error during heatmap generation: {e}")
-            cleanup_extracted_files()
             return False
-
-        # Clean up: delete the extracted directory after successful processing
-        cleanup_extracted_files()
         
         return True
     
+    except BrokenProcessPool:
+        cleanup_extracted_files()
+        raise
     except Exception as e:
         print(f"Error processing {os.path.basename(rar_path)}: {e}")
         import traceback
         print("Traceback:")
         traceback.print_exc()
         
-        # Clean up figure if it was created
-        if fig is not None:
-            try:
-                plt.close(fig)
-            except:
-                pass
-        
         # Always clean up extracted files for problematic RAR files
         cleanup_extracted_files()
         
         return False
 
+def process_rar_file_and_wait(rar_path, data_dir, result_dir):
+    """Process a RAR file in a worker process, waiting for its extracted files to be deleted."""
+    try:
+        return process_rar_file(rar_path, data_dir, result_dir)
+    finally:
+        # The cleanup thread of a worker process does not outlive the pool
+        wait_for_cleanup()
+
 # Main execution: Find and process all RAR files
 if __name__ == "__main__":
     # Parse command-line arguments
@@ -2130,6 +915,12 @@ if __name__ == "__main__":
                         help='Path to directory containing RAR files (absolute or relative path, default: D:)')
     parser.add_argument('--result', type=str, default=None,
                         help='Path to directory for output PNG files (default: result/ in project directory)')
+    parser.add_argument('--workers', type=int, default=min(os.cpu_count() or 1, DEFAULT_WORKERS),
+                        help=f'Number of processes used to render the hourly PNG files '
+                             f'(default: number of CPUs, at most {DEFAULT_WORKERS})')
+    parser.add_argument('--rar-workers', type=int, default=1,
+                        help='Number of RAR files processed at the same time, each in its own process '
+                             'rendering its hours itself (default: 1; every process holds a whole RAR file in memory)')
     
     args = parser.parse_args()
     
@@ -2171,15 +962,67 @@ if __name__ == "__main__":
     successful = 0
     failed = 0
     
-    for rar_path in sorted(rar_files):
+    # Start worker processes without fork: the prefetch and cleanup threads may
+    # already run when a pool starts its workers, and forking a process with
+    # live threads can deadlock the child
+    mp_context = multiprocessing.get_context(
+        'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn')
+    
+    if args.rar_workers > 1 and len(rar_files) > 1:
+        # RAR files are independent (own output directory and extraction
+        # directory), so process several at once, one per worker process
+        with ProcessPoolExecutor(max_workers=min(args.rar_workers, len(rar_files)),
+                                 mp_context=mp_context) as rar_executor:
+            futures = {rar_executor.submit(process_rar_file_and_wait, rar_path, data_dir, result_dir): rar_path
+                       for rar_path in sorted(rar_files)}
+            for future in as_completed(futures):
+                try:
+                    if future.result():
+                        successful += 1
+                    else:
+                        failed += 1
+                except Exception as e:
+                    print(f"Error processing {futures[future]}: {e}")
+                    failed += 1
+    else:
+        # Keep one pool of worker processes for all RAR files, so each worker sets
+        # up its figure once and reuses it for every hour it renders
+        executor = (ProcessPoolExecutor(max_workers=args.workers, mp_context=mp_context)
+                    if args.workers > 1 else None)
+        rar_paths = sorted(rar_files)
         try:
-            if process_rar_file(rar_path, data_dir, result_dir):
-                successful += 1
-            else:
-                failed += 1
-        except Exception as e:
-            print(f"Error processing {rar_path}: {e}")
-            failed += 1
+            # A background thread reads the next RAR file's HDF5 members while
+            # the current one is rendered (at most two archives held in memory)
+            with ThreadPoolExecutor(max_workers=1) as prefetcher:
+                next_members = prefetcher.submit(prefetch_h5_members, rar_paths[0], data_dir, result_dir)
+                for rar_idx, rar_path in enumerate(rar_paths):
+                    members = next_members
+                    next_members = None
+                    if rar_idx + 1 < len(rar_paths):
+                        next_members = prefetcher.submit(prefetch_h5_members, rar_paths[rar_idx + 1],
+                                                         data_dir, result_dir)
+                    try:
+                        if process_rar_file(rar_path, data_dir, result_dir, executor=executor, prefetched=members):
+                            successful += 1
+                        else:
+                            failed += 1
+                    except BrokenProcessPool as e:
+                        # A worker process died; start a new pool for the remaining RAR files
+                        print(f"Error processing {rar_path}: a render process died ({e})")
+                        print("Restarting the render processes for the remaining RAR files.")
+                        failed += 1
+                        executor.shutdown(wait=False)
+                        executor = ProcessPoolExecutor(max_workers=args.workers, mp_context=mp_context)
+                    except Exception as e:
+                        print(f"Error processing {rar_path}: {e}")
+                        failed += 1
+                    del members
+        finally:
+            if executor is not None:
+                executor.shutdown()
+    
+    # Wait for the background cleanup of extracted directories to finish
+    wait_for_cleanup()
     
     print(f"\n{'='*60}")
     print(f"Processing complete!")